@@ -0,0 +1,243 @@
+# assets.py  (shared surface atlas and image files)
+import os
+from time import perf_counter
+
+import pygame
+
+ANGLE_STEP = 1  # degrees; rotated variants are cached once per step
+
+# image files are looked up next to this module, not in the working directory
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+PLACEHOLDER_COLOR = (100, 100, 100)
+
+
+# --- Allocation counter ---
+_allocations = 0
+
+
+def count_allocation(n=1):
+    """Record Surfaces made outside new_surface (copies, rotations, text)."""
+    global _allocations
+    _allocations += n
+
+
+def new_surface(size, flags=0):
+    """pygame.Surface(size, flags), counted."""
+    count_allocation()
+    return pygame.Surface(size, flags)
+
+
+class AllocationCounter:
+    """
+    Surfaces allocated between begin() and end(), e.g. over one frame.
+    Only allocations that go through new_surface/count_allocation are seen.
+    """
+
+    def __init__(self):
+        self.last = 0
+        self.peak = 0
+        self.total = 0
+        self._start = 0
+
+    def begin(self):
+        self._start = _allocations
+
+    def end(self):
+        self.last = _allocations - self._start
+        self.total += self.last
+        if self.last > self.peak:
+            self.peak = self.last
+        return self.last
+
+
+# --- Shape builders: (w, h), colour -> new Surface ---
+def _rect(size, color):
+    surf = new_surface(size)
+    surf.fill(color)
+    return surf
+
+
+def _blank(size, color):
+    # fully transparent; color is ignored
+    return new_surface(size, pygame.SRCALPHA)
+
+
+def _box(size, color):
+    # like _rect but keeps per-pixel alpha, so rotated copies get clear corners
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, (0, 0, size[0], size[1]))
+    return surf
+
+
+def _circle(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (w // 2, h // 2), w // 2)
+    return surf
+
+
+def _rounded(size, color):
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, (0, 0, size[0], size[1]), border_radius=6)
+    return surf
+
+
+def _band(size, color):
+    # rounded bar across the middle half (Dual Blades)
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, (0, h // 4, w, h // 2), border_radius=6)
+    return surf
+
+
+def _triangle(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(surf, color, [(w // 2, 0), (0, h), (w, h)])
+    return surf
+
+
+def _cross(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, (w // 4, 0, w // 2, h))
+    pygame.draw.rect(surf, color, (0, h // 4, w, h // 2))
+    return surf
+
+
+# Circles for the draw.circle look-alikes: radius w // 2 - 1 about (w // 2, h // 2),
+# so a radius-r circle is size (2r + 2, 2r + 2) blitted at (cx - r - 1, cy - r - 1)
+def _disc(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (w // 2, h // 2), w // 2 - 1)
+    return surf
+
+
+def _ring(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (w // 2, h // 2), w // 2 - 1, 1)
+    return surf
+
+
+def _ring2(size, color):
+    w, h = size
+    surf = new_surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (w // 2, h // 2), w // 2 - 1, 2)
+    return surf
+
+
+_BUILDERS = {
+    "rect": _rect,
+    "blank": _blank,
+    "box": _box,
+    "circle": _circle,
+    "rounded": _rounded,
+    "band": _band,
+    "triangle": _triangle,
+    "cross": _cross,
+    "disc": _disc,
+    "ring": _ring,
+    "ring2": _ring2,
+}
+
+_atlas = {}
+
+
+def quantize_angle(angle_degrees):
+    return (round(angle_degrees / ANGLE_STEP) * ANGLE_STEP) % 360
+
+
+def get_surface(kind, size, color, angle=0):
+    """
+    Shared Surface for a (kind, size, colour, angle) look.
+    angle is a heading in degrees, snapped to ANGLE_STEP. Every caller asking
+    for the same look gets the same Surface, so never draw on or fill it.
+    """
+    angle = quantize_angle(angle)
+    key = (kind, size, color, angle)
+    surf = _atlas.get(key)
+    if surf is None:
+        surf = _BUILDERS[kind](size, color)
+        if angle:
+            surf = pygame.transform.rotate(surf, -angle)
+            count_allocation()
+        _atlas[key] = surf
+    return surf
+
+
+def blit_circle(target, kind, color, center, radius):
+    """
+    Blit the atlas "disc", "ring" or "ring2" of radius about center; the same
+    pixels as pygame.draw.circle(target, color, center, radius, 0 / 1 / 2).
+    """
+    if radius < 1:
+        return None
+    surf = get_surface(kind, (2 * radius + 2, 2 * radius + 2), color)
+    return target.blit(surf, (center[0] - radius - 1, center[1] - radius - 1))
+
+
+# --- Image files ---
+_files = {}  # name -> (Surface as loaded, display-converted?)
+_images = {}  # (name, size, angle) -> shared variant
+_load_times = {}  # name -> seconds spent reading, decoding and converting
+
+
+def _load_file(name, size):
+    start = perf_counter()
+    try:
+        surf = pygame.image.load(os.path.join(ASSET_DIR, name))
+        count_allocation()
+    except (pygame.error, OSError):
+        # missing or unreadable: a grey block keeps the game running
+        surf = new_surface(size or (32, 32))
+        surf.fill(PLACEHOLDER_COLOR)
+    converted = pygame.display.get_surface() is not None
+    if converted:
+        surf = surf.convert_alpha()
+        count_allocation()
+    _files[name] = (surf, converted)
+    _load_times[name] = perf_counter() - start
+    return surf, converted
+
+
+def load_image(name, size=None, angle=0):
+    """
+    Shared copy of image file `name` (relative to ASSET_DIR), scaled to size
+    and turned to heading `angle` (degrees, snapped to ANGLE_STEP, the same
+    convention as get_surface). The file is read once, and every variant is
+    built once; never draw on the result. Files loaded before a display mode
+    was set are converted to its format on the first request after.
+    """
+    entry = _files.get(name)
+    if entry is None or (not entry[1] and pygame.display.get_surface() is not None):
+        if entry is not None:
+            # built from the unconverted file; rebuild from the converted one
+            for key in [k for k in _images if k[0] == name]:
+                del _images[key]
+        _load_file(name, size)
+    angle = quantize_angle(angle)
+    key = (name, size, angle)
+    surf = _images.get(key)
+    if surf is None:
+        surf = _files[name][0]
+        if size is not None and surf.get_size() != size:
+            surf = pygame.transform.scale(surf, size)
+            count_allocation()
+        if angle:
+            surf = pygame.transform.rotate(surf, -angle)
+            count_allocation()
+        _images[key] = surf
+    return surf
+
+
+def preload(*specs):
+    """load_image(*spec) for each spec, e.g. preload(("plane.png", (100, 50)))."""
+    for spec in specs:
+        load_image(*spec)
+
+
+def load_timings():
+    """{file name: milliseconds} for every image file loaded so far."""
+    return {name: seconds * 1000.0 for name, seconds in _load_times.items()}
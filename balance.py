@@ -0,0 +1,303 @@
+# balance.py  (parallel Monte-Carlo balance runs with a pluggable bot)
+#
+# python balance.py --runs 500
+# python balance.py --runs 500 --set ENEMY_HEALTH_SCALE=1.3 --set BOSS_INTERVAL=4
+# python balance.py --runs 500 --set BOSS_HEALTH_GROWTH=1.1 --set BOSS_COOLDOWN_CUT=0.02
+# python balance.py --policy mybots:Dodger --json report.json
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import random
+from collections import Counter, defaultdict
+
+import numpy as np
+import pygame
+
+import game
+from game import Simulation, FrameInput, WIDTH, HEIGHT
+from player import BossEnemy
+
+# module-level knobs that --set may override, and the module that owns each
+TUNABLES = {
+    "BASE_ENEMIES": "game",
+    "ENEMY_HEALTH_SCALE": "game",
+    "BOSS_INTERVAL": "game",
+    # BossEnemy.apply_stage_scaling
+    "BOSS_BASE_STRENGTH": "player",
+    "BOSS_HEALTH_GROWTH": "player",
+    "BOSS_CONTACT_DAMAGE_GROWTH": "player",
+    "BOSS_PROJECTILE_DAMAGE_GROWTH": "player",
+    "BOSS_COOLDOWN_CUT": "player",
+    "BOSS_SPEED_GROWTH": "player",
+}
+
+# where each exit is, and the key that walks through it
+_EXITS = {
+    "up": ((WIDTH // 2, 0), pygame.K_w),
+    "down": ((WIDTH // 2, HEIGHT), pygame.K_s),
+    "left": ((0, HEIGHT // 2), pygame.K_a),
+    "right": ((WIDTH, HEIGHT // 2), pygame.K_d),
+}
+_NEIGHBOUR = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+
+# --- Bot policies ---
+# A policy is built as factory(seed) and then called once per frame as
+# policy(sim) -> inputs (FrameInput or anything indexable by key code).
+# Bots draw from their own Random so they never shift the game's stream.
+def _walk_towards(keys, px, py, tx, ty, slack=4):
+    if tx > px + slack:
+        keys.append(pygame.K_d)
+    elif tx < px - slack:
+        keys.append(pygame.K_a)
+    if ty > py + slack:
+        keys.append(pygame.K_s)
+    elif ty < py - slack:
+        keys.append(pygame.K_w)
+
+
+def _aim(keys, px, py, tx, ty):
+    dx, dy = tx - px, ty - py
+    if abs(dx) > abs(dy):
+        keys.append(pygame.K_RIGHT if dx > 0 else pygame.K_LEFT)
+    else:
+        keys.append(pygame.K_DOWN if dy > 0 else pygame.K_UP)
+
+
+class TurretBot:
+    """Stands still and shoots at the nearest enemy; leaves through the nearest new door."""
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.exit = None
+
+    def _nearest(self, sim):
+        px, py = sim.player.rect.center
+        enemies = sim.get_room().enemies.sprites()
+        if not enemies:
+            return None
+        return min(enemies, key=lambda e: (e.rect.centerx - px) ** 2 + (e.rect.centery - py) ** 2)
+
+    def _leave(self, sim, keys):
+        room = sim.get_room()
+        px, py = sim.player.rect.center
+        if room.powerups:
+            target = room.powerups.sprites()[0].rect.center
+            _walk_towards(keys, px, py, *target)
+            return
+        if self.exit is None or self.exit[0] is not room:
+            x, y = room.coords
+            fresh = [d for d, (dx, dy) in _NEIGHBOUR.items() if (x + dx, y + dy) not in sim.dungeon.rooms]
+            self.exit = (room, self.random.choice(fresh or list(_EXITS)))
+        (tx, ty), key = _EXITS[self.exit[1]]
+        # line up with the door first, then walk straight through it
+        if key in (pygame.K_w, pygame.K_s):
+            if abs(px - tx) > 4:
+                _walk_towards(keys, px, py, tx, py)
+                return
+        elif abs(py - ty) > 4:
+            _walk_towards(keys, px, py, px, ty)
+            return
+        keys.append(key)
+
+    def __call__(self, sim):
+        keys = []
+        target = self._nearest(sim)
+        if target is None:
+            self._leave(sim, keys)
+        else:
+            self.fight(sim, target, keys)
+        return FrameInput(keys)
+
+    def fight(self, sim, target, keys):
+        _aim(keys, *sim.player.rect.center, *target.rect.center)
+
+
+class ChaserBot(TurretBot):
+    """Keeps a middle distance from the nearest enemy, strafing while it shoots."""
+
+    KEEP = 180
+
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.strafe = 1
+
+    def fight(self, sim, target, keys):
+        px, py = sim.player.rect.center
+        ex, ey = target.rect.center
+        _aim(keys, px, py, ex, ey)
+        dist = math.hypot(ex - px, ey - py) or 1.0
+        if self.random.random() < 0.02:
+            self.strafe = -self.strafe
+        # perpendicular strafe, plus backing off or closing in
+        ux, uy = (ex - px) / dist, (ey - py) / dist
+        push = -1 if dist < self.KEEP else 1
+        mx = -uy * self.strafe + ux * push * 0.5
+        my = ux * self.strafe + uy * push * 0.5
+        _walk_towards(keys, px, py, px + mx * 10, py + my * 10, slack=2)
+
+
+POLICIES = {"turret": TurretBot, "chaser": ChaserBot}
+
+
+def load_policy(spec):
+    """A POLICIES name, or "module:attr" naming a policy factory."""
+    if spec in POLICIES:
+        return POLICIES[spec]
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+# --- One run ---
+def play(seed, policy="chaser", max_frames=60 * 60 * 10):
+    """
+    One seeded headless run until death or max_frames.
+    Returns plain data: depth, frames, per-hit damage, boss time-to-kill.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):  # room spawns announce bosses
+        sim = Simulation(seed=seed)
+        bot = load_policy(policy)(seed)
+        player = sim.player
+        health = player.health
+        hits = []
+        bosses = {}  # live boss -> (name, frame first seen)
+        boss_kills = []  # (name, frames to kill)
+        for _ in range(max_frames):
+            sim.step(bot(sim))
+            if player.health < health:
+                hits.append(health - player.health)
+            health = player.health
+
+            room = sim.get_room()
+            if room.is_boss_room:
+                for enemy in room.enemies:
+                    if isinstance(enemy, BossEnemy) and enemy not in bosses:
+                        bosses[enemy] = (getattr(enemy, "display_name", type(enemy).__name__), sim.frame)
+            for boss, (name, start) in list(bosses.items()):
+                if not boss.alive():
+                    boss_kills.append((name, sim.frame - start))
+                    del bosses[boss]
+            if sim.game_over:
+                break
+
+    killer = next(iter(bosses.values()))[0] if sim.game_over and bosses else None
+    return {
+        "seed": seed,
+        "depth": sim.dungeon.rooms_cleared_total,
+        "frames": sim.frame,
+        "died": sim.game_over,
+        "killed_by_boss": killer,
+        "hits": hits,
+        "boss_kills": boss_kills,
+    }
+
+
+def _apply_overrides(overrides):
+    for name, value in overrides.items():
+        setattr(importlib.import_module(TUNABLES[name]), name, value)
+
+
+def _play_task(task):
+    return play(*task)
+
+
+def run_batch(seeds, policy="chaser", max_frames=60 * 60 * 10, overrides=None, processes=None):
+    """Play one run per seed across a process pool; results come back in seed order."""
+    overrides = overrides or {}
+    tasks = [(seed, policy, max_frames) for seed in seeds]
+    pool = multiprocessing.Pool(processes, initializer=_apply_overrides, initargs=(overrides,))
+    try:
+        return pool.map(_play_task, tasks, chunksize=max(1, len(tasks) // (4 * (processes or os.cpu_count()))))
+    finally:
+        # close/join rather than the context manager's terminate(): SDL turns
+        # SIGTERM into a quit event, so terminated workers never exit
+        pool.close()
+        pool.join()
+
+
+# --- Report ---
+def _dist(values):
+    if not len(values):
+        return {"n": 0}
+    a = np.asarray(values, dtype=float)
+    p50, p90, p99 = np.percentile(a, (50, 90, 99))
+    return {"n": len(a), "mean": float(a.mean()), "p50": float(p50), "p90": float(p90),
+            "p99": float(p99), "max": float(a.max())}
+
+
+def summarize(results, fps=game.FPS):
+    ttk = defaultdict(list)
+    for r in results:
+        for name, frames in r["boss_kills"]:
+            ttk[name].append(frames / fps)
+    hit_sizes = Counter(h for r in results for h in r["hits"])
+    return {
+        "runs": len(results),
+        "deaths": sum(r["died"] for r in results),
+        "survival_depth": _dist([r["depth"] for r in results]),
+        "survival_seconds": _dist([r["frames"] / fps for r in results]),
+        "damage_taken_per_run": _dist([sum(r["hits"]) for r in results]),
+        "hit_sizes": dict(sorted(hit_sizes.items())),
+        "boss_ttk_seconds": {name: _dist(v) for name, v in sorted(ttk.items())},
+        "deaths_by_boss": dict(Counter(r["killed_by_boss"] for r in results if r["killed_by_boss"])),
+    }
+
+
+def _fmt(d):
+    if not d["n"]:
+        return "n=0"
+    return f"n={d['n']} mean={d['mean']:.1f} p50={d['p50']:.1f} p90={d['p90']:.1f} max={d['max']:.1f}"
+
+
+def format_report(report):
+    lines = [
+        f"runs {report['runs']}, deaths {report['deaths']}",
+        f"rooms cleared      {_fmt(report['survival_depth'])}",
+        f"seconds survived   {_fmt(report['survival_seconds'])}",
+        f"damage taken/run   {_fmt(report['damage_taken_per_run'])}",
+        f"hit sizes          {report['hit_sizes']}",
+        "boss time-to-kill (s):",
+    ]
+    ttk = report["boss_ttk_seconds"]
+    deaths = report["deaths_by_boss"]
+    for name in sorted(set(ttk) | set(deaths)):
+        lines.append(f"  {name:<14} {_fmt(ttk.get(name, {'n': 0}))}  deaths {deaths.get(name, 0)}")
+    return "\n".join(lines)
+
+
+def _parse_override(text):
+    name, _, value = text.partition("=")
+    if name not in TUNABLES:
+        raise argparse.ArgumentTypeError(f"{name} is not one of {', '.join(TUNABLES)}")
+    return name, type(getattr(importlib.import_module(TUNABLES[name]), name))(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel Monte-Carlo balance runs")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0, help="first seed; runs use seed..seed+runs-1")
+    parser.add_argument("--policy", default="chaser", help=f"{', '.join(POLICIES)} or module:factory")
+    parser.add_argument("--max-frames", type=int, default=60 * 60 * 10)
+    parser.add_argument("--processes", type=int, default=None, help="default: all cores")
+    parser.add_argument("--set", type=_parse_override, action="append", default=[], metavar="NAME=VALUE",
+                        help=f"override one of {', '.join(TUNABLES)}")
+    parser.add_argument("--json", help="write the report here")
+    args = parser.parse_args()
+
+    results = run_batch(range(args.seed, args.seed + args.runs), args.policy, args.max_frames,
+                        dict(args.set), args.processes)
+    report = summarize(results)
+    report["settings"] = {"policy": args.policy, "max_frames": args.max_frames, **dict(args.set)}
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# bench.py  (per-boss headless stress benchmark)
+#
+# python bench.py                              every boss at stages 0, 4, 8
+# python bench.py --bosses 0 19 --stages 10 --frames 3000
+# python bench.py --json now.json --baseline before.json
+import argparse
+import json
+import time
+import tracemalloc
+
+import pygame
+
+import game
+from game import Simulation, FrameInput, WIDTH, HEIGHT
+from player import BOSS_CLASS_LIST, create_boss_by_index
+
+# scripted player: walk a square around the lower half, shooting at the boss
+_WALK = (pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w)
+_WALK_FRAMES = 40
+
+
+def scripted_input(sim, frame, target):
+    keys = [_WALK[(frame // _WALK_FRAMES) % len(_WALK)]]
+    if target is not None:
+        dx = target.rect.centerx - sim.player.rect.centerx
+        dy = target.rect.centery - sim.player.rect.centery
+        if abs(dx) > abs(dy):
+            keys.append(pygame.K_RIGHT if dx > 0 else pygame.K_LEFT)
+        else:
+            keys.append(pygame.K_DOWN if dy > 0 else pygame.K_UP)
+    return FrameInput(keys)
+
+
+def stage_difficulty(stage):
+    """
+    difficulty_level of the room where the game spawns the boss of boss_stage
+    `stage`: that room comes after BOSS_INTERVAL * (stage + 1) - 1 cleared
+    rooms, and Room.unlock_doors sets difficulty to cleared // 3 + 1.
+    """
+    cleared = game.BOSS_INTERVAL * (stage + 1) - 1
+    return cleared // 3 + 1
+
+
+def setup_arena(index, stage, seed):
+    """Simulation whose current room holds only boss `index` at `stage`."""
+    sim = Simulation(seed=seed)
+    room = sim.get_room()
+    room.enemies.empty()
+    room.is_boss_room = True
+    difficulty = sim.dungeon.difficulty_level = stage_difficulty(stage)
+    boss = create_boss_by_index(index, WIDTH // 2, HEIGHT // 4, difficulty, stage)
+    room.enemies.add(boss)
+    player = sim.player
+    player.pos_x, player.pos_y = WIDTH // 2, HEIGHT * 3 // 4
+    player.rect.center = (player.pos_x, player.pos_y)
+    return sim, boss
+
+
+def run_scenario(index, stage, frames, seed):
+    """
+    Step one boss fight for `frames` frames. The boss and the player are
+    topped up every frame so the load stays constant for the whole run.
+    Returns (seconds, peak live enemy shots, peak live enemies).
+    """
+    sim, boss = setup_arena(index, stage, seed)
+    player = sim.player
+    room = sim.get_room()
+    shots = room.enemy_projectiles
+    peak_shots = peak_enemies = 0
+    elapsed = 0.0
+    for frame in range(frames):
+        boss.health = boss.max_health
+        if not boss.alive():
+            room.enemies.add(boss)
+        player.health = player.PLAYER_MAX_HEALTH
+        inputs = scripted_input(sim, frame, boss)
+        start = time.perf_counter()
+        sim.step(inputs)
+        elapsed += time.perf_counter() - start
+        peak_shots = max(peak_shots, len(shots))
+        peak_enemies = max(peak_enemies, len(room.enemies))
+    return elapsed, peak_shots, peak_enemies
+
+
+def measure_memory(index, stage, frames, seed):
+    """Peak traced Python/NumPy allocation during the scenario, in KiB."""
+    tracemalloc.start()
+    try:
+        run_scenario(index, stage, frames, seed)
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-boss headless stress benchmark")
+    parser.add_argument("--bosses", type=int, nargs="*", default=list(range(len(BOSS_CLASS_LIST))),
+                        help="boss indices (0-based)")
+    parser.add_argument("--stages", type=int, nargs="*", default=[0, 4, 8])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--json", help="write results here")
+    parser.add_argument("--baseline", help="earlier --json output to compare fps against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="flag runs this much slower than the baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {(r["boss"], r["stage"]): r for r in json.load(f)}
+
+    results = []
+    print(f"{'#':>2} {'boss':<18} {'stage':>5} {'fps':>8} {'shots':>6} {'enemies':>7} {'KiB':>7}")
+    for index in args.bosses:
+        name = BOSS_CLASS_LIST[index % len(BOSS_CLASS_LIST)].__name__
+        for stage in args.stages:
+            elapsed, peak_shots, peak_enemies = run_scenario(index, stage, args.frames, args.seed)
+            fps = args.frames / max(elapsed, 1e-9)
+            memory = None if args.no_memory else measure_memory(index, stage, args.frames, args.seed)
+            row = {"boss": index, "name": name, "stage": stage, "frames": args.frames, "fps": round(fps, 1),
+                   "peak_shots": peak_shots, "peak_enemies": peak_enemies, "peak_kib": memory}
+            results.append(row)
+
+            note = ""
+            base = baseline.get((index, stage))
+            if base:
+                change = fps / base["fps"] - 1.0
+                note = f" {change:+.0%}" + (" SLOWER" if change < -args.tolerance else "")
+            print(f"{index:>2} {name:<18} {stage:>5} {fps:>8.0f} {peak_shots:>6} {peak_enemies:>7} "
+                  f"{'-' if memory is None else memory:>7}{note}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# emission.py  (per-frame buffer for the shots and spawns enemy AI produces)
+import math
+
+import numpy as np
+
+from assets import get_surface
+
+ENEMY_SHOT_SPEED = 5.0
+ENEMY_SHOT_SIZE = (8, 8)
+ENEMY_SHOT_COLOR = (255, 150, 0)
+# frames a shot may live: longer than crossing the room corner to corner
+# takes, so only strays that left through an open door ever run out
+ENEMY_SHOT_TTL = 240
+
+
+class EmissionBuffer:
+    """
+    Written by Enemy.update(player, out) / think(player, out) instead of
+    returning projectile records and minions for Room.update to sort out;
+    patterns.py fires whole volleys through volley().
+    Room calls begin(enemy) before each enemy acts and commit() once after
+    all of them, so a frame's shots reach the ProjectileStore in one bulk
+    insert, in the order they were fired.
+
+    Shots fly straight at ENEMY_SHOT_SPEED until they hit a wall or reach
+    ENEMY_SHOT_TTL, and deal their shooter's projectile_damage
+    (contact_damage for enemies without one).
+    """
+
+    def __init__(self):
+        self.image = get_surface("rect", ENEMY_SHOT_SIZE, ENEMY_SHOT_COLOR)
+        self.shots = []  # (x, y, dx, dy, damage) fired one at a time
+        self.volleys = []  # (n, 5) arrays, with shots flushed in between to keep order
+        self.spawns = []
+        self.source = None
+
+    def begin(self, enemy):
+        self.source = enemy
+
+    def _damage(self):
+        enemy = self.source
+        return getattr(enemy, "projectile_damage", getattr(enemy, "contact_damage", 1))
+
+    # --- Commands ---
+    def aimed(self, x, y, player):
+        """Shot from (x, y) at the player's center."""
+        dx = player.rect.centerx - x
+        dy = player.rect.centery - y
+        dist = max(1.0, math.hypot(dx, dy))
+        self.shots.append((x, y, ENEMY_SHOT_SPEED * dx / dist, ENEMY_SHOT_SPEED * dy / dist, self._damage()))
+
+    def angled(self, x, y, angle):
+        """Shot from (x, y) heading `angle` degrees (0 = right, 90 = down)."""
+        rad = math.radians(angle)
+        self.shots.append((x, y, ENEMY_SHOT_SPEED * math.cos(rad), ENEMY_SHOT_SPEED * math.sin(rad), self._damage()))
+
+    def volley(self, x, y, ux, uy):
+        """len(ux) shots from (x, y) along the unit vectors (ux[i], uy[i])."""
+        chunk = np.empty((len(ux), 5))
+        chunk[:, 0] = x
+        chunk[:, 1] = y
+        np.multiply(ux, ENEMY_SHOT_SPEED, out=chunk[:, 2])
+        np.multiply(uy, ENEMY_SHOT_SPEED, out=chunk[:, 3])
+        chunk[:, 4] = self._damage()
+        self._flush()
+        self.volleys.append(chunk)
+
+    def spawn(self, enemy):
+        self.spawns.append(enemy)
+
+    # --- Commit ---
+    def _flush(self):
+        if self.shots:
+            self.volleys.append(np.array(self.shots))
+            self.shots.clear()
+
+    def commit(self, store, enemies):
+        """Move buffered shots into store and spawns into the enemies group, then clear."""
+        self._flush()
+        volleys = self.volleys
+        if volleys:
+            rows = volleys[0] if len(volleys) == 1 else np.concatenate(volleys)
+            x, y, dx, dy, damage = rows.T
+            store.spawn_many(x, y, dx, dy, self.image, damage, fly_time=ENEMY_SHOT_TTL)
+            volleys.clear()
+        if self.spawns:
+            enemies.add(*self.spawns)
+            self.spawns.clear()
+        self.source = None
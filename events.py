@@ -0,0 +1,50 @@
+# events.py  (per-room scheduler for GameEvents)
+import heapq
+
+
+class EventScheduler:
+    """
+    A room's GameEvents. schedule() queues an event to start `delay` ticks
+    from now; pending events wait in a heap ordered by (start tick, order
+    scheduled), so only the due ones are touched. tick() starts whatever is
+    due and ticks every running event once, in start order; render() draws
+    the running ones and changes nothing.
+
+    Time is the scheduler's own tick count, so the events of a room that is
+    not being updated (or is hibernated) simply wait.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.pending = []  # heap of (start tick, seq, event)
+        self.running = []
+        self._seq = 0
+
+    def __len__(self):
+        return len(self.pending) + len(self.running)
+
+    def schedule(self, event, delay=0):
+        heapq.heappush(self.pending, (self.now + delay, self._seq, event))
+        self._seq += 1
+
+    def tick(self, player, enemy_index, particles):
+        pending = self.pending
+        running = self.running
+        while pending and pending[0][0] <= self.now:
+            running.append(heapq.heappop(pending)[2])
+        self.now += 1
+        if running:
+            for event in running:
+                event.tick(player, enemy_index, particles)
+            self.running = [event for event in running if event.active]
+
+    def render(self, screen):
+        for event in self.running:
+            event.render(screen)
+
+    def hibernate(self):
+        """Let every event drop what render() cached; the room is being put away."""
+        for _, _, event in self.pending:
+            event.hibernate()
+        for event in self.running:
+            event.hibernate()
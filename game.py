@@ -0,0 +1,690 @@
+# game.py  (headless game world: rooms, dungeon and the fixed-step Simulation)
+import random
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from player import (
+    Player, Enemy, ShooterEnemy, JumperEnemy,
+    AirstrikeEvent, create_boss_by_index, chase_all, is_chaser
+)
+from assets import AllocationCounter, get_surface, new_surface
+from emission import EmissionBuffer
+from events import EventScheduler
+from particles import ParticleEmitter
+from projectiles import ProjectileStore
+from runtime import SimClock, bind, rng, start_run
+from spatial import SpatialHash, WallMap
+
+# --- Settings ---
+WIDTH, HEIGHT = 800, 600
+FPS = 60
+
+# --- Colors ---
+DARK_GREY = (59, 59, 59)
+
+# --- Difficulty Scaling ---
+BASE_ENEMIES = 3
+ENEMY_HEALTH_SCALE = 1.2
+BOSS_INTERVAL = 5  # Boss every 5 cleared rooms
+
+# --- Room Streaming ---
+# Rooms kept live at once (the current one included); the least recently
+# visited of the rest are hibernated into RoomRecords.
+RESIDENT_ROOMS = 4
+
+# --- Enemy Shots ---
+# live shots a room keeps before retiring the oldest, and the area outside
+# which a shot is dropped (it can no longer reach the player)
+MAX_ENEMY_SHOTS = 512
+SHOT_BOUNDS = (-64, -64, WIDTH + 64, HEIGHT + 64)
+
+# --- Inputs ---
+# Keys the simulation reads each frame: WASD moves, arrows shoot.
+INPUT_KEYS = (
+    pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT
+)
+
+
+class FrameInput:
+    """
+    Keys held during one simulation frame.
+    Indexable like pygame.key.get_pressed(), so Player.update can read either.
+    """
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# --- Wall Class ---
+class Wall(pygame.sprite.Sprite):
+    def __init__(self, x, y, w, h):
+        super().__init__()
+        self.image = get_surface("rect", (w, h), DARK_GREY)
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+# --- Room Layout ---
+class RoomLayout:
+    """
+    Wall geometry shared by every room of one size: outer walls with a door
+    gap in each side, plus the four blocks that seal the gaps while a room is
+    locked. Built once per size by room_layout(); rooms keep only their
+    doors_locked flag and pick the matching wall group and layer from here.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        wall_thickness = 40
+        door_width = 100
+        door_block_thickness = 10
+        door_start_h = width // 2 - door_width // 2
+        door_end_h = width // 2 + door_width // 2
+        door_start_v = height // 2 - door_width // 2
+        door_end_v = height // 2 + door_width // 2
+
+        # --- Permanent Base Walls (creating the door gap) ---
+        base = (
+            Wall(0, 0, door_start_h, wall_thickness),
+            Wall(door_end_h, 0, width - door_end_h, wall_thickness),
+            Wall(0, height - wall_thickness, door_start_h, wall_thickness),
+            Wall(door_end_h, height - wall_thickness, width - door_end_h, wall_thickness),
+            Wall(0, 0, wall_thickness, door_start_v),
+            Wall(0, door_end_v, wall_thickness, height - door_end_v),
+            Wall(width - wall_thickness, 0, wall_thickness, door_start_v),
+            Wall(width - wall_thickness, door_end_v, wall_thickness, height - door_end_v),
+        )
+
+        # --- Door Blocks (Fill the gap when locked; they meet the base walls) ---
+        doors = (
+            Wall(door_start_h, 0, door_width, door_block_thickness),
+            Wall(door_start_h, height - door_block_thickness, door_width, door_block_thickness),
+            Wall(0, door_start_v, door_block_thickness, door_width),
+            Wall(width - door_block_thickness, door_start_v, door_block_thickness, door_width),
+        )
+
+        # shared groups: never add to or kill() from these
+        self.open_walls = pygame.sprite.Group(*base)
+        self.locked_walls = pygame.sprite.Group(*base, *doors)
+        # collision maps for movement; the door state picks one
+        self.open_map = WallMap([w.rect for w in base], width, height)
+        self.locked_map = WallMap([w.rect for w in base + doors], width, height)
+        self._layers = {}
+
+    def walls(self, doors_locked):
+        return self.locked_walls if doors_locked else self.open_walls
+
+    def wall_map(self, doors_locked):
+        return self.locked_map if doors_locked else self.open_map
+
+    def layer(self, doors_locked, background_color):
+        """Floor and walls pre-rendered as one opaque Surface (needs a display mode)."""
+        key = (doors_locked, background_color)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = new_surface((self.width, self.height)).convert()
+            layer.fill(background_color)
+            self.walls(doors_locked).draw(layer)
+            self._layers[key] = layer
+        return layer
+
+
+_LAYOUTS = {}
+
+
+def room_layout(width=WIDTH, height=HEIGHT):
+    """The interned RoomLayout for rooms of this size."""
+    layout = _LAYOUTS.get((width, height))
+    if layout is None:
+        layout = _LAYOUTS[(width, height)] = RoomLayout(width, height)
+    return layout
+
+
+# --- PowerUp ---
+class PowerUp(pygame.sprite.Sprite):
+    TYPES = ["health", "multi", "speed", "rapid", "pierce", "explosive"]
+
+    def __init__(self, x, y, kind=None):
+        super().__init__()
+        self.type = kind if kind else rng.choice(PowerUp.TYPES)
+        cmap = {
+            "health": (0, 255, 0),
+            "multi": (0, 200, 255),
+            "speed": (0, 0, 255),
+            "rapid": (255, 255, 0),
+            "pierce": (255, 100, 0),
+            "explosive": (200, 0, 200)
+        }
+        self.image = get_surface("rect", (20, 20), cmap.get(self.type, (255, 255, 255)))
+        self.rect = self.image.get_rect(center=(x, y))
+        self.timer = 20 * FPS
+
+    def update(self):
+        self.timer -= 1
+        if self.timer <= 0:
+            self.kill()
+
+
+# --- Room Entry ---
+# Where the player stands after walking into a room, by the direction moved
+# (None: the start of a run). A transition only sets one axis, so the other
+# can be anywhere along the door gap.
+ENTRY_POINTS = {
+    None: (WIDTH // 2, HEIGHT // 2),
+    "up": (WIDTH // 2, HEIGHT - 100),
+    "down": (WIDTH // 2, 100),
+    "left": (WIDTH - 120, HEIGHT // 2),
+    "right": (120, HEIGHT // 2),
+}
+MOVES = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+# enemies spawn at least this far from the entry point: 200 px plus half a
+# door, since the player can come through anywhere along the gap
+SPAWN_CLEARANCE = 250
+
+
+# --- Enemy Spawning ---
+def spawn_enemy_type():
+    r = rng.random()
+    if r < 0.6:
+        return Enemy
+    elif r < 0.85:
+        return ShooterEnemy
+    else:
+        return JumperEnemy
+
+
+def spawn_enemy_clear_of(entry):
+    """Random enemy at least SPAWN_CLEARANCE from the point the player enters at."""
+    ex, ey = entry
+    for _ in range(200):
+        x = rng.randint(150, WIDTH - 150)
+        y = rng.randint(150, HEIGHT - 150)
+        dist = ((x - ex) ** 2 + (y - ey) ** 2) ** 0.5
+        if dist > SPAWN_CLEARANCE:
+            return spawn_enemy_type()(x, y)
+    # fall back to the corner of the spawn area farthest from the entry
+    corners = ((150, 150), (WIDTH - 150, 150), (150, HEIGHT - 150), (WIDTH - 150, HEIGHT - 150))
+    return spawn_enemy_type()(*max(corners, key=lambda c: (c[0] - ex) ** 2 + (c[1] - ey) ** 2))
+
+
+# --- Room ---
+class Room:
+    def __init__(self, x, y, dungeon):
+        self.coords = (x, y)
+        self.dungeon = dungeon
+        self.enemies = pygame.sprite.Group()
+        self.enemy_index = SpatialHash()  # broadphase over enemies, rebuilt per frame
+        self.powerups = pygame.sprite.Group()
+        self.enemy_projectiles = ProjectileStore(max_live=MAX_ENEMY_SHOTS)
+        self.emissions = EmissionBuffer()
+        self.events = EventScheduler()
+        self.layout = room_layout()  # walls are shared; only the door state is ours
+        self.cleared = False
+        self.doors_locked = True
+        self.is_boss_room = False
+
+        # boss UI state
+        self.boss_ui_alpha = 0
+        self.boss_ui_fade = False
+        self.boss_spawned = False
+        self.announcement = None  # printed when the player first walks in
+
+    @property
+    def walls(self):
+        return self.layout.walls(self.doors_locked)
+
+    @property
+    def wall_map(self):
+        """WallMap of the current walls; what movement code collides against."""
+        return self.layout.wall_map(self.doors_locked)
+
+    def wall_layer(self, background_color):
+        """This room's floor and walls as one cached Surface, for the renderers."""
+        return self.layout.layer(self.doors_locked, background_color)
+
+    def spawn_enemies(self, entry):
+        """Populate a new room; entry is the ENTRY_POINTS spot the player will come in at."""
+        # Determine if this room should spawn a boss
+        dungeon = self.dungeon
+
+        if dungeon.rooms_cleared_total > 0 and (dungeon.rooms_cleared_total + 1) % BOSS_INTERVAL == 0:
+            self.is_boss_room = True
+
+            # Determine boss index (0-based) and boss stage
+            boss_num = ((dungeon.rooms_cleared_total + 1) // BOSS_INTERVAL) - 1
+            boss_index = boss_num % 20
+            boss_stage = boss_num  # number of bosses that have been faced before
+
+            # Create boss via helper (now passes boss_stage)
+            boss = create_boss_by_index(boss_index, WIDTH // 2, HEIGHT // 2, dungeon.difficulty_level, boss_stage)
+            self.enemies.add(boss)
+            self.boss_ui_fade = True
+            self.boss_ui_alpha = 0
+            self.boss_spawned = True
+            self.announcement = f"BOSS SPAWNED: #{boss_index+1} ({getattr(boss, 'display_name', boss.__class__.__name__)}) Health {boss.max_health}"
+        else:
+            # Spawn regular enemies
+            num_enemies = int(BASE_ENEMIES + dungeon.difficulty_level * 0.5)
+
+            for _ in range(rng.randint(num_enemies, num_enemies + 2)):
+                e = spawn_enemy_clear_of(entry)
+                # Scale enemy health
+                e.max_health = int(e.max_health * (ENEMY_HEALTH_SCALE ** (dungeon.difficulty_level - 1)))
+                e.health = e.max_health
+                self.enemies.add(e)
+
+    def open_doors(self):
+        # walls now resolves to the layout's group without the door blocks
+        self.doors_locked = False
+
+    def unlock_doors(self):
+        self.open_doors()
+
+        # Increase cleared room count and scale difficulty
+        self.dungeon.rooms_cleared_total += 1
+        self.dungeon.difficulty_level = (self.dungeon.rooms_cleared_total // 3) + 1
+        self.dungeon.stage_neighbours(self.coords)
+
+    def update(self, player, particles, projectiles):
+        # events (like airstrike); they draw later, from the render pass
+        if self.events:
+            self.enemy_index.rebuild(self.enemies)
+            self.events.tick(player, self.enemy_index, particles)
+
+        # enemy AI: plain chasers move in one batch, then everything acts in
+        # group order, writing shots and spawns into the emission buffer
+        enemies = self.enemies.sprites()
+        chasers = [is_chaser(enemy) for enemy in enemies]
+        chase_all([e for e, c in zip(enemies, chasers) if c], player)
+        out = self.emissions
+        for enemy, chaser in zip(enemies, chasers):
+            out.begin(enemy)
+            if chaser:
+                enemy.think(player, out)
+            else:
+                enemy.update(player, out)
+        out.commit(self.enemy_projectiles, self.enemies)
+
+        # check clear
+        if not self.cleared and not self.enemies:
+            self.cleared = True
+            self.unlock_doors()
+            # drop powerup chance
+            if rng.random() < 0.75 or self.is_boss_room:
+                self.powerups.add(PowerUp(WIDTH // 2, HEIGHT // 2))
+
+            # If it was a boss room, drop an extra guaranteed powerup
+            if self.is_boss_room:
+                self.powerups.add(PowerUp(WIDTH // 2 + 50, HEIGHT // 2 + 50))
+
+            # Chance to trigger an Airstrike
+            if rng.random() < 0.2:
+                airstrike = AirstrikeEvent(
+                    WIDTH, HEIGHT,
+                    player.rect.centerx,
+                    player.rect.centery
+                )
+                self.events.schedule(airstrike)
+
+
+    def reap(self):
+        """Drop the enemy shots in flight (and the pool they grew); called when the player leaves."""
+        self.enemy_projectiles = ProjectileStore(max_live=MAX_ENEMY_SHOTS)
+
+    # --- Hibernation ---
+    def hibernate(self):
+        """Compact RoomRecord of this room; the Room itself can then be dropped."""
+        record = RoomRecord()
+        record.coords = self.coords
+        record.cleared = self.cleared
+        record.doors_locked = self.doors_locked
+        record.is_boss_room = self.is_boss_room
+        record.boss_ui = (self.boss_ui_alpha, self.boss_ui_fade, self.boss_spawned)
+        record.enemies = tuple(self.enemies)
+        record.powerups = tuple((pu.rect.centerx, pu.rect.centery, pu.type, pu.timer) for pu in self.powerups)
+        if self.events:
+            self.events.hibernate()
+            record.events = self.events
+        else:
+            record.events = None
+        return record
+
+    @classmethod
+    def from_record(cls, record, dungeon):
+        """Rebuild a hibernated room exactly as it was left. Draws nothing from rng."""
+        room = cls(*record.coords, dungeon)
+        room.cleared = record.cleared
+        if not record.doors_locked:
+            room.open_doors()
+        room.is_boss_room = record.is_boss_room
+        room.boss_ui_alpha, room.boss_ui_fade, room.boss_spawned = record.boss_ui
+        room.enemies.add(*record.enemies)
+        for x, y, kind, timer in record.powerups:
+            pu = PowerUp(x, y, kind)
+            pu.timer = timer
+            room.powerups.add(pu)
+        if record.events is not None:
+            room.events = record.events
+        return room
+
+
+class RoomRecord:
+    """
+    What a hibernated room keeps: its flags, leftover powerups and running
+    events. Walls, sprite groups and an empty shot pool are rebuilt by
+    Room.from_record; enemy shots were already dropped by reap() when the
+    player left.
+
+    enemies keeps the sprites themselves on purpose: rooms are only left
+    once cleared, so it is normally empty, and every enemy and boss class
+    carries its own state that a plain-data copy would have to mirror.
+    Events are kept as objects for the same reason, with their render caches
+    (the airstrike's warning layer) dropped by EventScheduler.hibernate().
+    """
+
+    __slots__ = ("coords", "cleared", "doors_locked", "is_boss_room", "boss_ui",
+                 "enemies", "powerups", "events")
+
+
+# --- Dungeon ---
+class Dungeon:
+    """
+    The rooms of one run, keyed by coords. rooms maps to a live Room for the
+    `resident_rooms` most recently visited rooms and to a RoomRecord for the
+    rest; load_room rehydrates records on re-entry.
+
+    Unvisited rooms next to a room whose doors just opened are generated
+    ahead of time, one per pregenerate() call (Simulation.step makes one each
+    frame), so walking through a door only has to pick the staged room up.
+    Staged rooms are stamped with rooms_cleared_total and the direction they
+    expect the player from; a room entered under a different stamp is
+    generated afresh.
+    """
+
+    def __init__(self, resident_rooms=None):
+        self.rooms = {}
+        self.resident = OrderedDict()  # coords of live Rooms, least recently visited first
+        self.resident_rooms = max(1, RESIDENT_ROOMS if resident_rooms is None else resident_rooms)
+        self.current = (0, 0)
+        self.staged = {}  # coords -> (rooms_cleared_total, direction, Room)
+        self.stage_queue = []  # (direction, coords) still to generate
+
+        # run progression (difficulty scales with rooms cleared)
+        self.rooms_cleared_total = 0
+        self.difficulty_level = 1
+
+        self.load_room(0, 0)
+
+    def generate_room(self, coords, direction):
+        room = Room(*coords, self)
+        room.spawn_enemies(ENTRY_POINTS[direction])
+        return room
+
+    def load_room(self, x, y, direction=None):
+        """Enter (x, y), walking in from `direction` (None at the start of a run)."""
+        coords = (x, y)
+        left = self.rooms.get(self.current)
+        if left is not None and self.current != coords:
+            left.reap()
+        room = self.rooms.get(coords)
+        if room is None:
+            staged = self.staged.pop(coords, None)
+            if staged is not None and staged[:2] == (self.rooms_cleared_total, direction):
+                room = staged[2]
+            else:
+                room = self.generate_room(coords, direction)
+            self.rooms[coords] = room
+            if room.announcement:
+                print(room.announcement)
+        elif isinstance(room, RoomRecord):
+            self.rooms[coords] = Room.from_record(room, self)
+        self.current = coords
+
+        resident = self.resident
+        resident[coords] = True
+        resident.move_to_end(coords)
+        while len(resident) > self.resident_rooms:
+            old, _ = resident.popitem(last=False)
+            self.rooms[old] = self.rooms[old].hibernate()
+
+    def get_room(self):
+        return self.rooms[self.current]
+
+    def move(self, direction):
+        x, y = self.current
+        dx, dy = MOVES[direction]
+        self.load_room(x + dx, y + dy, direction)
+
+    # --- Pre-generation ---
+    def stage_neighbours(self, coords):
+        """Queue the unvisited rooms around coords; anything staged earlier is stale now."""
+        self.staged.clear()
+        x, y = coords
+        self.stage_queue = [(d, (x + dx, y + dy)) for d, (dx, dy) in MOVES.items()
+                            if (x + dx, y + dy) not in self.rooms]
+
+    def pregenerate(self):
+        """Generate at most one queued room into staged."""
+        if self.stage_queue:
+            direction, coords = self.stage_queue.pop(0)
+            if coords not in self.rooms:
+                self.staged[coords] = (self.rooms_cleared_total, direction, self.generate_room(coords, direction))
+
+
+# --- Transition Check ---
+def check_room_transition(player, dungeon):
+    margin = 10
+    px, py = player.rect.center
+
+    if dungeon.get_room().doors_locked:
+        return
+
+    if py < margin:  # top
+        dungeon.move("up")
+        player.pos_y = ENTRY_POINTS["up"][1]
+    elif py > HEIGHT - margin:
+        dungeon.move("down")
+        player.pos_y = ENTRY_POINTS["down"][1]
+    elif px < margin:
+        dungeon.move("left")
+        player.pos_x = ENTRY_POINTS["left"][0]
+    elif px > WIDTH - margin:
+        dungeon.move("right")
+        player.pos_x = ENTRY_POINTS["right"][0]
+
+    player.rect.centerx = int(player.pos_x)
+    player.rect.centery = int(player.pos_y)
+
+
+# --- PowerUp Pickup ---
+def apply_powerup(player, kind):
+    if kind == "health":
+        player.health = min(player.PLAYER_MAX_HEALTH, player.health + 2)
+    elif kind == "multi":
+        if player.multi_shot_level == 1:
+            player.multi_shot_level = 3
+        else:
+            player.multi_shot_level += 2
+    elif kind == "speed":
+        player.speed_level += 1
+    elif kind == "rapid":
+        player.rapid_level += 1
+    elif kind == "pierce":
+        player.piercing_level += 1
+    elif kind == "explosive":
+        player.explosive_level += 1
+
+
+# --- Simulation ---
+class Simulation:
+    """
+    One run of the game world, advanced a fixed frame at a time by step().
+    Owns no window and never sleeps, so it can be stepped headless as fast as
+    the CPU allows. The windowed client in test.py drives the same object
+    and draws room events with room.events.render().
+
+    seed: seeds the run's random stream; None picks one. The same seed and
+    the same inputs always replay the same run.
+
+    Each Simulation owns its random stream and clock; reset() and step()
+    bind them to runtime.rng and runtime.ticks(), so several runs can be
+    built and stepped side by side in one process. Code that creates
+    enemies or rooms outside step() must bind() the simulation first.
+
+    profiler: optional FrameProfiler; step() charges its work to the
+    "update" and "collisions" phases.
+    """
+
+    def __init__(self, seed=None):
+        self.clock = SimClock(FPS)
+        self.random = random.Random()
+        self.player = Player(WIDTH // 2, HEIGHT // 2)
+        self.player_group = pygame.sprite.GroupSingle(self.player)
+        self.projectiles = ProjectileStore()
+        self.particles = ParticleEmitter()
+        # Surfaces allocated by the last step(); 0 in steady state
+        self.allocations = AllocationCounter()
+        self.profiler = None
+        self.reset(seed)
+
+    @property
+    def frame(self):
+        return self.clock.frame
+
+    def bind(self):
+        """Make runtime.rng and runtime.ticks() this run's."""
+        bind(self.random, self.clock)
+
+    def reset(self, seed=None):
+        """Start a fresh run with the same Player object."""
+        self.seed = start_run(self.random, self.clock, seed)
+        self.particles.rng = np.random.default_rng(self.seed)
+        player = self.player
+        self.dungeon = Dungeon()
+        player.health = player.PLAYER_MAX_HEALTH
+        player.multi_shot_level = 1
+        player.speed_level = 0
+        player.rapid_level = 0
+        player.piercing_level = 0
+        player.explosive_level = 0
+        player.last_shot_time = 0
+        player.invul_timer = 0
+        self.projectiles.empty()
+        self.particles.empty()
+        player.pos_x, player.pos_y = WIDTH // 2, HEIGHT // 2
+        player.rect.center = (WIDTH // 2, HEIGHT // 2)
+        self.score = 0
+        self.game_over = False
+
+    def get_room(self):
+        return self.dungeon.get_room()
+
+    def step(self, inputs):
+        """
+        Advance the world by one frame.
+        inputs: pygame.key.get_pressed() or a FrameInput.
+        """
+        if self.game_over:
+            return
+        self.bind()
+        self.allocations.begin()
+        profiler = self.profiler
+        if profiler:
+            profiler.phase("update")
+        self.clock.advance()
+        player = self.player
+
+        # Player shooting
+        if player.can_attack():
+            direction = None
+            if inputs[pygame.K_UP]:
+                direction = "up"
+            elif inputs[pygame.K_DOWN]:
+                direction = "down"
+            elif inputs[pygame.K_LEFT]:
+                direction = "left"
+            elif inputs[pygame.K_RIGHT]:
+                direction = "right"
+            if direction:
+                for p in player.attack(direction):
+                    self.projectiles.add(p)
+
+        room = self.dungeon.get_room()
+        wall_map = room.wall_map
+        self.player_group.update(wall_map, inputs)
+        self.projectiles.update(wall_map)
+        self.particles.update()
+        room.powerups.update()
+        room.enemy_projectiles.update(wall_map, SHOT_BOUNDS)
+
+        room.update(player, self.particles, self.projectiles)
+        check_room_transition(player, self.dungeon)
+
+        if profiler:
+            profiler.phase("collisions")
+        self.resolve_collisions(room)
+        if profiler:
+            profiler.phase("update")
+
+        if player.health <= 0:
+            self.game_over = True
+
+        # build one upcoming room per frame instead of all of it at the door
+        self.dungeon.pregenerate()
+        self.allocations.end()
+
+    def resolve_collisions(self, room):
+        player = self.player
+
+        # Enemy collisions (now uses player.take_damage for i-frames/knockback)
+        for enemy in list(room.enemies):
+            if player.rect.colliderect(enemy.rect):
+                player.take_damage(enemy.rect.centerx, enemy.rect.centery, damage=getattr(enemy, "contact_damage", 1))
+
+        # Projectile hits (unchanged - applies damage to enemies)
+        projectiles = self.projectiles
+        room.enemy_index.rebuild(room.enemies)
+        for i in projectiles.live():
+            hits = room.enemy_index.query_rect(projectiles.rect(i))
+            if hits:
+                explosive = int(projectiles.explosive[i])
+                if explosive > 0:
+                    radius = 50 + explosive * 20
+                    for enemy in room.enemy_index.query_radius(projectiles.center(i), radius):
+                        ex, ey = enemy.rect.center
+                        for _ in range(1 + explosive):
+                            if enemy.take_hit():
+                                enemy.kill()
+                                self.score += 1
+                                self.particles.emit(ex, ey, 6)
+                    projectiles.kill(i)
+                else:
+                    for enemy in hits:
+                        if projectiles.hits_left[i] > 0:
+                            if enemy.take_hit():
+                                enemy.kill()
+                                self.score += 1
+                                self.particles.emit(enemy.rect.centerx, enemy.rect.centery, 6)
+                            projectiles.hits_left[i] -= 1
+                        if projectiles.hits_left[i] <= 0:
+                            projectiles.kill(i)
+                            break
+
+        # Enemy projectiles (now uses player.take_damage for i-frames/knockback)
+        shots = room.enemy_projectiles
+        for i in shots.collide_rect(player.rect):
+            cx, cy = shots.center(i)
+            shots.kill(i)
+            player.take_damage(cx, cy, damage=int(shots.damage[i]))
+
+        # Powerups
+        collected = pygame.sprite.spritecollide(player, room.powerups, True)
+        for pu in collected:
+            apply_powerup(player, pu.type)
@@ -0,0 +1,131 @@
+# hud.py  (HUD rendering helpers: cached text, boss plate)
+from collections import OrderedDict
+
+import pygame
+
+from assets import count_allocation, new_surface
+
+
+class TextCache:
+    """
+    LRU cache of rendered text, keyed by font, string, antialias flag and colour.
+    HUD strings rarely change between frames, so most lookups return the
+    Surface rendered on an earlier frame and cost only the blit.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def render(self, font, text, antialias, color):
+        """Same arguments as font.render, minus the background."""
+        key = (font, text, antialias, color)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            return surf
+        surf = font.render(text, antialias, color)
+        count_allocation()
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+
+# --- Boss UI ---
+BOSS_BAR_FG = (200, 130, 60)
+BOSS_NAME_COLOR = (230, 210, 170)
+
+
+class BossBar:
+    """
+    Top-centered boss plate: medieval frame, boss name and health bar.
+    The frame is rendered once per boss; the bar is recomposed only when the
+    boss's health or the low-health pulse changes, and fading is applied as
+    surface alpha at blit time. Only the plate's bounding box is kept, so the
+    per-frame cost is one blit of that region.
+    """
+
+    UI_H = 88
+    BAR_W = 600
+    BAR_H = 18
+
+    def __init__(self, font, width, text_cache=None):
+        self.font = font
+        self.width = width
+        self.text_cache = text_cache
+        plate_x = width // 2 - 340
+        self.plate_rect = (plate_x, 8, 680, 36)
+        # horns stick 12px out of the plate on both sides
+        self.area = pygame.Rect(plate_x - 12, 0, 680 + 25, self.UI_H)
+        self.boss = None
+        self.frame = None
+        self.surf = None
+        self.bar_key = None
+
+    def _render_text(self, text, color):
+        if self.text_cache is not None:
+            return self.text_cache.render(self.font, text, True, color)
+        count_allocation()
+        return self.font.render(text, True, color)
+
+    def _build_frame(self, boss):
+        ui_w = self.width
+        surf = new_surface((ui_w, self.UI_H), pygame.SRCALPHA)
+        plate_rect = self.plate_rect
+        # medieval-ish glowing frame (simple)
+        pygame.draw.rect(surf, (20, 14, 10), plate_rect, border_radius=8)
+        pygame.draw.rect(surf, (80, 50, 30), (plate_rect[0]+4, plate_rect[1]+4, plate_rect[2]-8, plate_rect[3]-8), border_radius=6)
+        # spikes/decals on sides (medieval: stylized horns)
+        left_x = plate_rect[0]
+        right_x = plate_rect[0] + plate_rect[2]
+        mid_y = plate_rect[1] + plate_rect[3]//2
+        pygame.draw.polygon(surf, (60, 40, 25), [(left_x-12, mid_y), (left_x+6, mid_y-12), (left_x+6, mid_y+12)])
+        pygame.draw.polygon(surf, (60, 40, 25), [(right_x+12, mid_y), (right_x-6, mid_y-12), (right_x-6, mid_y+12)])
+        # decorative rivets
+        for i in range(6):
+            rx = plate_rect[0] + 20 + i * 110
+            pygame.draw.circle(surf, (100, 70, 50), (rx, plate_rect[1] + plate_rect[3]//2), 4)
+
+        # boss name (bold)
+        name_text = self._render_text(f"BOSS: {getattr(boss, 'display_name', boss.__class__.__name__)}", BOSS_NAME_COLOR)
+        name_x = ui_w//2 - name_text.get_width()//2
+        surf.blit(name_text, (name_x, plate_rect[1]-26))
+
+        # plates behind the health bar
+        bar_x, bar_y = self._bar_pos()
+        pygame.draw.rect(surf, (20, 12, 8), (bar_x-6, bar_y-6, self.BAR_W+12, self.BAR_H+12), border_radius=10)
+        pygame.draw.rect(surf, (50, 20, 10), (bar_x, bar_y, self.BAR_W, self.BAR_H), border_radius=8)
+        count_allocation()
+        return surf.subsurface(self.area).copy()
+
+    def _bar_pos(self):
+        plate_rect = self.plate_rect
+        return self.width//2 - self.BAR_W//2, plate_rect[1] + plate_rect[3] + 8
+
+    def draw(self, screen, boss, alpha, ticks):
+        """ticks: milliseconds, drives the pulse below 25% health."""
+        if boss is not self.boss:
+            self.boss = boss
+            self.frame = self._build_frame(boss)
+            self.bar_key = None
+
+        ratio = max(0.0, boss.health / boss.max_health)
+        cur_w = int(self.BAR_W * ratio)
+        # pulse if < 25%
+        pulse = 0
+        if ratio < 0.25:
+            pulse = int((1 + (ticks // 200) % 2) * 6)
+
+        if (cur_w, pulse) != self.bar_key:
+            self.bar_key = (cur_w, pulse)
+            self.surf = self.frame.copy()
+            count_allocation()
+            bar_x, bar_y = self._bar_pos()
+            bar_x -= self.area.x
+            pygame.draw.rect(self.surf, BOSS_BAR_FG,
+                             (bar_x - pulse//2, bar_y - pulse//2, max(2, cur_w + pulse), self.BAR_H + pulse), border_radius=8)
+
+        # draw the composed UI onto main screen with overall alpha
+        self.surf.set_alpha(alpha)
+        return screen.blit(self.surf, (self.area.x, 8 + self.area.y))
@@ -0,0 +1,97 @@
+# particles.py  (fixed-capacity, array-backed particle emitter)
+import numpy as np
+
+from assets import get_surface
+
+PARTICLE_SIZE = 4
+PARTICLE_COLOR = (255, 200, 100)
+
+
+class ParticleEmitter:
+    """
+    Fixed pool of short-lived 4x4 sparks.
+    Slots are reused through a free list, so emitting never allocates; when the
+    pool is full extra sparks are dropped. update() moves and ages every spark
+    in one vectorized pass and draw() blits them with a single Surface.blits.
+
+    Particles are cosmetic, so they draw from their own NumPy generator and
+    never touch the gameplay random stream.
+    """
+
+    def __init__(self, capacity=1024, seed=None):
+        self.x = np.zeros(capacity, dtype=np.int64)  # rect top-left
+        self.y = np.zeros(capacity, dtype=np.int64)
+        self.dx = np.zeros(capacity, dtype=np.int64)  # per-frame step, already truncated
+        self.dy = np.zeros(capacity, dtype=np.int64)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.color_id = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.free = list(range(capacity - 1, -1, -1))
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        # atlas Surfaces by colour id
+        self.images = []
+        self.color_ids = {}
+
+    def __len__(self):
+        return self.count
+
+    def _color_id(self, color):
+        cid = self.color_ids.get(color)
+        if cid is None:
+            image = get_surface("rect", (PARTICLE_SIZE, PARTICLE_SIZE), color)
+            cid = len(self.images)
+            self.images.append(image)
+            self.color_ids[color] = cid
+        return cid
+
+    def emit(self, x, y, count, color=PARTICLE_COLOR):
+        """Burst of count sparks centered on (x, y)."""
+        n = min(count, len(self.free))
+        if n <= 0:
+            return
+        free = self.free
+        idx = np.array(free[len(free) - n:], dtype=np.int64)
+        del free[len(free) - n:]
+        half = PARTICLE_SIZE // 2
+        rng = self.rng
+        self.x[idx] = int(x) - half
+        self.y[idx] = int(y) - half
+        # int() truncation of the old float velocities, applied once up front
+        self.dx[idx] = np.trunc(rng.uniform(-2, 2, n))
+        self.dy[idx] = np.trunc(rng.uniform(-2, 2, n))
+        self.lifetime[idx] = rng.integers(10, 21, n)
+        self.color_id[idx] = self._color_id(color)
+        self.alive[idx] = True
+        self.count += n
+
+    def update(self):
+        if not self.count:
+            return
+        alive = self.alive
+        self.x += self.dx
+        self.y += self.dy
+        self.lifetime -= 1
+        dead = np.flatnonzero(alive & (self.lifetime <= 0))
+        if len(dead):
+            alive[dead] = False
+            self.free.extend(dead.tolist())
+            self.count -= len(dead)
+
+    def empty(self):
+        idx = np.flatnonzero(self.alive)
+        self.alive[idx] = False
+        self.free.extend(idx.tolist())
+        self.count = 0
+
+    def draw(self, surface, dirty=False):
+        """Blit every live row; with dirty=True return the blitted rects."""
+        if not self.count:
+            return []
+        idx = np.flatnonzero(self.alive)
+        images = self.images
+        return surface.blits([(images[c], (x, y)) for c, x, y in
+                       zip(self.color_id[idx].tolist(), self.x[idx].tolist(), self.y[idx].tolist())],
+                      doreturn=dirty)
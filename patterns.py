@@ -0,0 +1,97 @@
+# patterns.py  (declarative enemy bullet patterns over cached direction tables)
+#
+# A pattern fires a whole volley into an emission.EmissionBuffer with one
+# volley() call. Headings come from unit-vector tables built once per shape
+# and shared by every boss using it, so a volley costs the same however many
+# bullets it holds.
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=1024)
+def _table(angles):
+    """Read-only (ux, uy) arrays for a tuple of headings in degrees (0 = right, 90 = down)."""
+    rads = [math.radians(a) for a in angles]
+    ux = np.array([math.cos(r) for r in rads])
+    uy = np.array([math.sin(r) for r in rads])
+    ux.flags.writeable = False
+    uy.flags.writeable = False
+    return ux, uy
+
+
+@lru_cache(maxsize=1024)
+def _ring(count, turn):
+    return _table(tuple(turn + i * (360 / count) for i in range(count)))
+
+
+def aim(x, y, player):
+    """Unit vector from (x, y) to the player's center; straight right when on top of it."""
+    dx = player.rect.centerx - x
+    dy = player.rect.centery - y
+    dist = math.hypot(dx, dy)
+    if dist == 0:
+        return 1.0, 0.0
+    return dx / dist, dy / dist
+
+
+class Radial:
+    """count shots evenly round the circle; fire(turn=...) rotates the ring."""
+
+    def __init__(self, count):
+        self.count = count
+
+    def fire(self, out, x, y, turn=0):
+        out.volley(x, y, *_ring(self.count, turn))
+
+
+class AimedSpread:
+    """One shot per offset (degrees) from the direction to the player."""
+
+    def __init__(self, offsets):
+        self.cos, self.sin = _table(tuple(offsets))
+
+    def fire(self, out, x, y, player):
+        ax, ay = aim(x, y, player)
+        # rotate the offset table onto the aim direction
+        out.volley(x, y, ax * self.cos - ay * self.sin, ay * self.cos + ax * self.sin)
+
+
+class Cone(AimedSpread):
+    """count shots spread evenly over `spread` degrees, centred on the player."""
+
+    def __init__(self, count, spread):
+        if count <= 1:
+            super().__init__((0.0,))
+        else:
+            step = spread / (count - 1)
+            super().__init__([-spread / 2 + step * i for i in range(count)])
+
+
+class Stream:
+    """
+    Single aimed shots every `rate` ticks once start()ed. step() is called
+    every tick and says whether a shot is due; the stream stops on the first
+    tick past `duration` that does not fire.
+    """
+
+    def __init__(self, rate, duration):
+        self.rate = rate
+        self.duration = duration
+        self.active = False
+        self.tick = 0
+
+    def start(self):
+        self.active = True
+        self.tick = 0
+
+    def step(self):
+        if not self.active:
+            return False
+        self.tick += 1
+        if self.tick % self.rate == 0:
+            return True
+        if self.tick >= self.duration:
+            self.active = False
+        return False
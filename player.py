@@ -1,7 +1,12 @@
 # player.py  (UPDATED with boss abilities)
 import pygame
 import math
-import random
+
+import numpy as np
+
+from assets import blit_circle, get_surface, load_image, new_surface
+from patterns import AimedSpread, Cone, Radial, Stream
+from runtime import rng, ticks
 
 pygame.init()
 # --- Constants ---
@@ -16,6 +21,14 @@ ENEMY_SIZE = 30
 ENEMY_COLOR = (255, 0, 0)
 ENEMY_SPEED = 2
 
+# --- Boss Stage Scaling (BossEnemy.apply_stage_scaling) ---
+BOSS_BASE_STRENGTH = 3.0  # boss HP multiplier at stage 0
+BOSS_HEALTH_GROWTH = 1.2  # HP multiplier per boss stage
+BOSS_CONTACT_DAMAGE_GROWTH = 1.15  # per boss stage
+BOSS_PROJECTILE_DAMAGE_GROWTH = 1.2  # per boss stage
+BOSS_COOLDOWN_CUT = 0.04  # shoot cooldown shrinks by this fraction per stage
+BOSS_SPEED_GROWTH = 0.03  # movement speeds grow by this fraction per stage
+
 # --- Colors ---
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
@@ -29,10 +42,11 @@ class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         # Create a base image for drawing and flashing
-        self.original_image = pygame.Surface((PLAYER_RADIUS * 2, PLAYER_RADIUS * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.original_image, BLUE, (PLAYER_RADIUS, PLAYER_RADIUS), PLAYER_RADIUS)
+        self.original_image = get_surface("circle", (PLAYER_RADIUS * 2, PLAYER_RADIUS * 2), BLUE)
+        # shared, never drawn on: update() swaps between these by reference
+        self.flash_image = get_surface("blank", (PLAYER_RADIUS * 2, PLAYER_RADIUS * 2), None)
 
-        self.image = self.original_image.copy()
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=(x, y))
 
         # floating pos for smooth movement of any sub-pixels
@@ -81,13 +95,10 @@ class Player(pygame.sprite.Sprite):
             if self.invul_timer % self.flash_interval == 0:
                 self.is_flashing = not self.is_flashing
 
-            if self.is_flashing:
-                # Use a transparent image during the flash
-                self.image = pygame.Surface((PLAYER_RADIUS * 2, PLAYER_RADIUS * 2), pygame.SRCALPHA)
-            else:
-                self.image = self.original_image.copy()
+            # Use a transparent image during the flash
+            self.image = self.flash_image if self.is_flashing else self.original_image
         else:
-            self.image = self.original_image.copy()
+            self.image = self.original_image
             self.is_flashing = False
 
         # --- Movement Logic ---
@@ -102,16 +113,16 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_d]:
             dx = spd
 
-        # move and collide with walls
+        # move and collide with walls (a spatial.WallMap of the room)
         self.pos_x += dx
         self.rect.centerx = int(self.pos_x)
-        if pygame.sprite.spritecollide(self, walls, False):
+        if walls.collide_rect(self.rect):
             self.pos_x -= dx
             self.rect.centerx = int(self.pos_x)
 
         self.pos_y += dy
         self.rect.centery = int(self.pos_y)
-        if pygame.sprite.spritecollide(self, walls, False):
+        if walls.collide_rect(self.rect):
             self.pos_y -= dy
             self.rect.centery = int(self.pos_y)
 
@@ -141,7 +152,7 @@ class Player(pygame.sprite.Sprite):
         # cooldown reduced multiplicatively by rapid_level stacks
         cooldown = SHOOT_COOLDOWN * (0.8 ** self.rapid_level) if self.rapid_level > 0 else SHOOT_COOLDOWN
         cooldown = max(50, int(cooldown))
-        return pygame.time.get_ticks() - self.last_shot_time > cooldown
+        return ticks() - self.last_shot_time > cooldown
 
 
     def attack(self, direction):
@@ -150,9 +161,9 @@ class Player(pygame.sprite.Sprite):
         direction: 'up','down','left','right'
         multi_shot_level stores the pellet count (1, 3, 5, 7, ...).
         """
-        self.last_shot_time = pygame.time.get_ticks()
-        random_integer = random.randint(1, 10)
-        random_integer2 = random.randint(1, 10)
+        self.last_shot_time = ticks()
+        random_integer = rng.randint(1, 10)
+        random_integer2 = rng.randint(1, 10)
 
         if direction == "up":
             base_angle = -90.0 + (random_integer) - (random_integer2)
@@ -185,79 +196,42 @@ class Player(pygame.sprite.Sprite):
         return projectiles
 
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile:
+    """
+    Spawn record for a player bolt.
+    The live bolt is a row in a projectiles.ProjectileStore, which moves it,
+    ages it and removes it on wall contact or after fly_time frames.
+    """
+
     def __init__(self, x, y, angle_degrees, piercing=0, explosive=0):
-        super().__init__()
         self.piercing = piercing
         self.explosive = explosive
         # hits_left: how many enemies it can damage before disappearing
         self.hits_left = max(1, piercing + 1)
+        self.damage = 1
 
         # Make explosive bolts visually bigger and chunkier depending on explosive level
-        base_w = 14 + 4 * explosive
-        base_h = 4 + 2 * explosive
-        base = pygame.Surface((base_w, base_h), pygame.SRCALPHA)
+        size = (14 + 4 * explosive, 4 + 2 * explosive)
         # explosive-looking tint if explosive > 0
-        if explosive > 0:
-            tint = (255, 180, 60)
-            pygame.draw.rect(base, tint, (0, 0, base_w, base_h))
-        else:
-            pygame.draw.rect(base, YELLOW, (0, 0, base_w, base_h))
-        self.image = pygame.transform.rotate(base, -angle_degrees)
-        self.rect = self.image.get_rect(center=(x, y))
-
-        self.pos_x = float(self.rect.centerx)
-        self.pos_y = float(self.rect.centery)
+        tint = (255, 180, 60) if explosive > 0 else YELLOW
+        self.image = get_surface("box", size, tint, angle_degrees)
+        self.pos_x = x
+        self.pos_y = y
 
         rad = math.radians(angle_degrees)
         self.dx = PROJECTILE_SPEED * math.cos(rad)
         self.dy = PROJECTILE_SPEED * math.sin(rad)
 
-        self.age = 0
         self.fly_time = 45  # explosive bolts fly a bit longer
 
-    def update(self, walls=None):
-        self.age += 1
-        self.pos_x += self.dx
-        self.pos_y += self.dy
-        self.rect.centerx = int(self.pos_x)
-        self.rect.centery = int(self.pos_y)
-
-        # collide with walls -> vanish
-        if walls and pygame.sprite.spritecollideany(self, walls):
-            self.kill()
-            return
-
-        if self.age >= self.fly_time:
-            self.kill()
-
-
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color=(255, 200, 100)):
-        super().__init__()
-        self.image = pygame.Surface((4, 4))
-        self.image.fill(color)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.dx = random.uniform(-2, 2)
-        self.dy = random.uniform(-2, 2)
-        self.lifetime = random.randint(10, 20)
-
-    def update(self):
-        self.rect.x += int(self.dx)
-        self.rect.y += int(self.dy)
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
-
 
 # --- Enemies ---
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE))
         self.original_color = ENEMY_COLOR
         self.flash_color = (255, 255, 0)
-        self.image.fill(self.original_color)
+        self.image = get_surface("rect", (ENEMY_SIZE, ENEMY_SIZE), self.original_color)
         self.rect = self.image.get_rect(center=(x, y))
 
         self.max_health = 2
@@ -267,22 +241,33 @@ class Enemy(pygame.sprite.Sprite):
         # contact damage (touch)
         self.contact_damage = 1
 
-    def update(self, player):
-        if self.flash_timer > 0:
-            self.flash_timer -= 1
-            if self.flash_timer == 0:
-                self.image.fill(self.original_color)
+    def update(self, player, out):
+        # Subclasses that keep this update are plain chasers: Room.update moves
+        # them all at once with chase_all() and then calls think() on each.
+        self.chase(player)
+        self.think(player, out)
 
+    def chase(self, player):
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
         dist = max(1.0, math.hypot(dx, dy))
         self.rect.x += int(ENEMY_SPEED * dx / dist)
         self.rect.y += int(ENEMY_SPEED * dy / dist)
-        return None
+
+    def think(self, player, out):
+        """Everything update() does besides moving; shots and spawns go to out."""
+        if self.flash_timer > 0:
+            self.flash_timer -= 1
+            if self.flash_timer == 0:
+                self.image = self.tinted(self.original_color)
+
+    def tinted(self, color):
+        """Shared solid image the size of the current one (hit flashes, recolours)."""
+        return get_surface("rect", self.image.get_size(), color)
 
     def take_hit(self):
         self.health -= 1
-        self.image.fill(self.flash_color)
+        self.image = self.tinted(self.flash_color)
         self.flash_timer = 15
         return self.health <= 0
 
@@ -302,25 +287,57 @@ class Enemy(pygame.sprite.Sprite):
         pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, current_width, bar_height))
 
 
+# below this many chasers the per-object loop beats NumPy's call overhead
+CHASE_BATCH_MIN = 8
+
+
+def is_chaser(enemy):
+    """True when enemy moves exactly like Enemy (its class keeps Enemy.update)."""
+    return type(enemy).update is Enemy.update
+
+
+def chase_all(chasers, player):
+    """
+    Enemy.chase for a list of chasers in one NumPy pass.
+    Same arithmetic as the per-object version, int() truncation included.
+    """
+    if len(chasers) < CHASE_BATCH_MIN:
+        for enemy in chasers:
+            enemy.chase(player)
+        return
+    rects = [enemy.rect for enemy in chasers]
+    cx = np.fromiter((r.centerx for r in rects), dtype=np.float64, count=len(rects))
+    cy = np.fromiter((r.centery for r in rects), dtype=np.float64, count=len(rects))
+    dx = player.rect.centerx - cx
+    dy = player.rect.centery - cy
+    # the sum of squares is exact for on-screen distances, so this matches math.hypot
+    dist = np.maximum(1.0, np.sqrt(dx * dx + dy * dy))
+    # astype truncates toward zero, like int()
+    step_x = (ENEMY_SPEED * dx / dist).astype(np.int64).tolist()
+    step_y = (ENEMY_SPEED * dy / dist).astype(np.int64).tolist()
+    for rect, sx, sy in zip(rects, step_x, step_y):
+        rect.x += sx
+        rect.y += sy
+
+
 # --- BOSS BASE CLASS ---
 class BossEnemy(Enemy):
     """
     Generic boss base. Subclasses should override visuals and behavior.
-    Subclasses should return:
-        - None (no action)
-        - EnemyProjectile instance
-        - Projectile-like instance
-        - Enemy instance (to spawn minions)
-        - list of the above
-    Room.update in main.py handles different result types.
+    update(player, out) writes its attacks into out, an emission.EmissionBuffer:
+        - out.aimed(x, y, player)  shot at the player
+        - out.angled(x, y, angle)  shot at angle degrees
+        - out.spawn(enemy)         minion
+    Volleys go through patterns.py (Radial, Cone, AimedSpread, Stream), which
+    write a whole volley into out at once.
+    Room.update commits the buffer once all enemies have acted.
     """
 
     def __init__(self, x, y, difficulty_level):
         # Use a larger default and override in subclass
         super().__init__(x, y)
         self.original_color = (150, 0, 150)
-        self.image = pygame.Surface((int(ENEMY_SIZE * 2.5), int(ENEMY_SIZE * 2.5)))
-        self.image.fill(self.original_color)
+        self.image = get_surface("rect", (int(ENEMY_SIZE * 2.5), int(ENEMY_SIZE * 2.5)), self.original_color)
         self.rect = self.image.get_rect(center=(x, y))
 
         # Boss stats scale with difficulty (difficulty_level starting at 1)
@@ -368,7 +385,7 @@ class BossEnemy(Enemy):
         to make bosses progressively more punishing while keeping their identity.
         """
         # Strength multiplier: starts ~3x, grows ~1.2^stage
-        strength_multiplier = 3.0 * (1.2 ** boss_stage)
+        strength_multiplier = BOSS_BASE_STRENGTH * (BOSS_HEALTH_GROWTH ** boss_stage)
 
         # Increase max health multiplicatively
         old_hp = self.max_health
@@ -377,20 +394,20 @@ class BossEnemy(Enemy):
         self.health = self.max_health
 
         # Increase contact and projectile damage more moderately
-        self.contact_damage = max(1, int(self.contact_damage * (1.15 ** boss_stage) * (1 + (difficulty_level - 1) * 0.08)))
-        self.projectile_damage = max(1, int(self.projectile_damage * (1.2 ** boss_stage) * (1 + (difficulty_level - 1) * 0.05)))
+        self.contact_damage = max(1, int(self.contact_damage * (BOSS_CONTACT_DAMAGE_GROWTH ** boss_stage) * (1 + (difficulty_level - 1) * 0.08)))
+        self.projectile_damage = max(1, int(self.projectile_damage * (BOSS_PROJECTILE_DAMAGE_GROWTH ** boss_stage) * (1 + (difficulty_level - 1) * 0.05)))
 
         # Reduce shoot cooldown (make more frequent) but clamp
         if hasattr(self, "shoot_cooldown"):
-            self.shoot_cooldown = max(6, int(self.shoot_cooldown * max(0.4, 1.0 - boss_stage * 0.04)))
+            self.shoot_cooldown = max(6, int(self.shoot_cooldown * max(0.4, 1.0 - boss_stage * BOSS_COOLDOWN_CUT)))
 
         # Boost movement/behavior if they have movement attributes
         if hasattr(self, "speed"):
-            self.speed *= (1.0 + boss_stage * 0.03)
+            self.speed *= (1.0 + boss_stage * BOSS_SPEED_GROWTH)
         if hasattr(self, "patrol_speed"):
-            self.patrol_speed *= (1.0 + boss_stage * 0.03)
+            self.patrol_speed *= (1.0 + boss_stage * BOSS_SPEED_GROWTH)
         if hasattr(self, "dash_speed"):
-            self.dash_speed *= (1.0 + boss_stage * 0.03)
+            self.dash_speed *= (1.0 + boss_stage * BOSS_SPEED_GROWTH)
         # make certain bosses spawn more minions at higher stages
         if hasattr(self, "num_orbiters"):
             self.num_orbiters = min(8, self.num_orbiters + boss_stage // 3)
@@ -408,9 +425,7 @@ class BossEnemy(Enemy):
 
 # Helper small function to create small orbiters (visual only) for some bosses
 def _make_orbiter_image(radius, color):
-    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-    pygame.draw.circle(surf, color, (radius, radius), radius)
-    return surf
+    return get_surface("circle", (radius * 2, radius * 2), color)
 
 
 class Boss01_Core(BossEnemy):
@@ -418,8 +433,7 @@ class Boss01_Core(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 1.2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (120, 120, 120), (size // 2, size // 2), size // 2)
+        self.image = get_surface("circle", (size, size), (120, 120, 120))
         self.rect = self.image.get_rect(center=(x, y))
         self.max_health = int(8 * (1.15 ** difficulty_level))
         self.health = self.max_health
@@ -429,7 +443,7 @@ class Boss01_Core(BossEnemy):
         self.display_name = "Mini Core"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         # slowly track and periodically fire a direct projectile at player
         self.timer += 1
         dx = player.rect.centerx - self.rect.centerx
@@ -440,8 +454,7 @@ class Boss01_Core(BossEnemy):
 
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
-            return EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage)
-        return None
+            out.aimed(self.rect.centerx, self.rect.centery, player)
 
 
 class Boss02_Blades(BossEnemy):
@@ -450,8 +463,7 @@ class Boss02_Blades(BossEnemy):
         super().__init__(x, y, difficulty_level)
         w = int(ENEMY_SIZE * 2.0)
         h = int(ENEMY_SIZE * 1.6)
-        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (200, 120, 120), (0, h // 4, w, h // 2), border_radius=6)
+        self.image = get_surface("band", (w, h), (200, 120, 120))
         self.rect = self.image.get_rect(center=(x, y))
         self.max_health = int(20 * (1.25 ** difficulty_level))
         self.health = self.max_health
@@ -465,7 +477,7 @@ class Boss02_Blades(BossEnemy):
         self.display_name = "Dual Blades"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.dash_timer += 1
         if self.dashing:
             self.dash_tick += 1
@@ -475,7 +487,7 @@ class Boss02_Blades(BossEnemy):
                 self.dashing = False
                 self.dash_tick = 0
             # No projectile; relies on high-contact damage
-            return None
+            return
         else:
             # small repositioning
             dx = player.rect.centerx - self.rect.centerx
@@ -493,7 +505,6 @@ class Boss02_Blades(BossEnemy):
             self.dash_dir = (dx / mag, dy / mag)
             self.dashing = True
             self.dash_tick = 0
-        return None
 
 
 class Boss03_Burster(BossEnemy):
@@ -501,38 +512,23 @@ class Boss03_Burster(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (220, 50, 50), (size // 2, size // 2), size // 2)
+        self.image = get_surface("circle", (size, size), (220, 50, 50))
         self.rect = self.image.get_rect(center=(x, y))
         self.max_health = int(18 * (1.2 ** difficulty_level))
         self.health = self.max_health
         self.shoot_cooldown = max(30, 85 - difficulty_level * 3)
         self.shots = 5 + difficulty_level // 2
+        self.spread = Cone(self.shots, 40)  # 40 degrees wide
         self.timer = 0
         self.display_name = "Burster"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
             # create a spread of projectiles aimed near the player
-            base_dx = player.rect.centerx - self.rect.centerx
-            base_dy = player.rect.centery - self.rect.centery
-            base_angle = math.degrees(math.atan2(base_dy, base_dx))
-            spread = 40  # degrees
-            shots = []
-            if self.shots <= 1:
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage))
-            else:
-                start = base_angle - spread / 2
-                step = spread / max(1, self.shots - 1)
-                for i in range(self.shots):
-                    angle = start + step * i
-                    shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=angle, damage=self.projectile_damage))
-            return shots
-        # small wander
-        return None
+            self.spread.fire(out, self.rect.centerx, self.rect.centery, player)
 
 
 class Boss04_Crawler(BossEnemy):
@@ -541,8 +537,7 @@ class Boss04_Crawler(BossEnemy):
         super().__init__(x, y, difficulty_level)
         w = int(ENEMY_SIZE * 3.2)
         h = int(ENEMY_SIZE * 0.9)
-        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (100, 200, 100), (0, 0, w, h), border_radius=6)
+        self.image = get_surface("rounded", (w, h), (100, 200, 100))
         self.rect = self.image.get_rect(center=(x, y + 100))
         self.pos_x = float(self.rect.centerx)
         self.pos_y = float(self.rect.centery)
@@ -551,11 +546,12 @@ class Boss04_Crawler(BossEnemy):
         self.patrol_dir = 1
         self.patrol_speed = 2 + difficulty_level * 0.1
         self.shoot_cooldown = 120 - difficulty_level * 2
+        self.shockwave = AimedSpread((-10, 0, 10))
         self.timer = 0
         self.display_name = "Crawler"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         # patrol left-right
         self.rect.x += int(self.patrol_speed * self.patrol_dir)
         if self.rect.left < 60 or self.rect.right > 740:
@@ -565,15 +561,8 @@ class Boss04_Crawler(BossEnemy):
         self.timer += 1
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
-            projectiles = []
             # 3 heavy, slow projectiles aimed at player with small spread
-            base_dx = player.rect.centerx - self.rect.centerx
-            base_dy = player.rect.centery - self.rect.centery
-            base_angle = math.degrees(math.atan2(base_dy, base_dx))
-            for a in (-10, 0, 10):
-                projectiles.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=base_angle + a, damage=self.projectile_damage + 1))
-            return projectiles
-        return None
+            self.shockwave.fire(out, self.rect.centerx, self.rect.centery, player)
 
 
 class Boss05_Sentinel(BossEnemy):
@@ -581,8 +570,7 @@ class Boss05_Sentinel(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.6)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((180, 180, 220))
+        self.image = get_surface("rect", (size, size), (180, 180, 220))
         self.rect = self.image.get_rect(center=(x, y))
         self.max_health = int(28 * (1.22 ** difficulty_level))
         self.health = self.max_health
@@ -591,20 +579,17 @@ class Boss05_Sentinel(BossEnemy):
         self.display_name = "Sentinel"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         # slightly hover around center
-        self.rect.x += int(math.sin(pygame.time.get_ticks() * 0.001) * 1.2)
-        self.rect.y += int(math.cos(pygame.time.get_ticks() * 0.001) * 1.0)
+        self.rect.x += int(math.sin(ticks() * 0.001) * 1.2)
+        self.rect.y += int(math.cos(ticks() * 0.001) * 1.0)
 
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
             # spawn several homing shots (they always target the player)
-            shots = []
             for _ in range(2 + (self.boss_stage // 3 if hasattr(self, "boss_stage") else 0)):
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage))
-            return shots
-        return None
+                out.aimed(self.rect.centerx, self.rect.centery, player)
 
 
 class Boss06_Orbweaver(BossEnemy):
@@ -612,8 +597,7 @@ class Boss06_Orbweaver(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (140, 80, 200), (size // 2, size // 2), size // 2)
+        self.image = get_surface("circle", (size, size), (140, 80, 200))
         self.rect = self.image.get_rect(center=(x, y))
         self.orbiters = []
         self.num_orbiters = 3 + (difficulty_level // 4)
@@ -627,7 +611,7 @@ class Boss06_Orbweaver(BossEnemy):
         self.display_name = "Orbweaver"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         # rotate orbiters (visual only) and occasionally fire radial bursts
         self.timer += 1
         for i, orb in enumerate(self.orbiters):
@@ -635,14 +619,8 @@ class Boss06_Orbweaver(BossEnemy):
 
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
-            shots = []
-            # radial burst
-            count = 6 + (self.num_orbiters)
-            for i in range(count):
-                angle = i * (360 / count)
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=angle, damage=self.projectile_damage))
-            return shots
-        return None
+            # radial burst (num_orbiters grows with the boss stage after __init__)
+            Radial(6 + self.num_orbiters).fire(out, self.rect.centerx, self.rect.centery)
 
 
 class Boss07_Sprinter(BossEnemy):
@@ -650,8 +628,7 @@ class Boss07_Sprinter(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 1.8)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.polygon(self.image, (230, 130, 30), [(size // 2, 0), (0, size), (size, size)])
+        self.image = get_surface("triangle", (size, size), (230, 130, 30))
         self.rect = self.image.get_rect(center=(x, y))
         self.charge_cooldown = max(40, 140 - difficulty_level * 5)
         self.charge_timer = 0
@@ -664,7 +641,7 @@ class Boss07_Sprinter(BossEnemy):
         self.display_name = "Sprinter"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.charge_timer += 1
         if self.charging:
             self.charge_tick += 1
@@ -675,7 +652,7 @@ class Boss07_Sprinter(BossEnemy):
                 self.charge_tick = 0
         else:
             # small hops around center
-            self.rect.x += int(math.sin(pygame.time.get_ticks() * 0.002) * 1.0)
+            self.rect.x += int(math.sin(ticks() * 0.002) * 1.0)
 
         if self.charge_timer >= self.charge_cooldown:
             self.charge_timer = 0
@@ -685,7 +662,6 @@ class Boss07_Sprinter(BossEnemy):
             self.charge_dir = (dx / mag, dy / mag)
             self.charging = True
             self.charge_tick = 0
-        return None
 
 
 class Boss08_Warden(BossEnemy):
@@ -693,8 +669,7 @@ class Boss08_Warden(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.8)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((90, 140, 180))
+        self.image = get_surface("rect", (size, size), (90, 140, 180))
         self.rect = self.image.get_rect(center=(x, y))
         self.shield_timer = 0
         self.shield_duration = 60
@@ -703,39 +678,36 @@ class Boss08_Warden(BossEnemy):
         self.max_health = int(32 * (1.25 ** difficulty_level))
         self.health = self.max_health
         self.display_name = "Warden"
+        self.ring = Radial(6)
         self.projectile_damage = 1
 
     def take_hit(self):
         # invulnerable during shield
         if self.shield_timer > 0:
             # flash but don't take damage
-            self.image.fill((150, 180, 200))
+            self.image = self.tinted((150, 180, 200))
             self.flash_timer = 6
             return False
         return super().take_hit()
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.shield_timer > 0:
             self.shield_timer -= 1
             # while shielded, do small radial bullets
             if self.timer % 8 == 0:
                 # shoot outward in 6 directions
-                shots = []
-                for a in range(6):
-                    angle = a * (360 / 6)
-                    shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=angle, damage=self.projectile_damage))
-                return shots
+                self.ring.fire(out, self.rect.centerx, self.rect.centery)
+                return
         else:
             # normal attack: single targeted projectile occasionally
             if self.timer >= self.shield_cooldown:
                 self.timer = 0
                 self.shield_timer = self.shield_duration
-                return None
+                return
 
             if self.timer % 50 == 0:
-                return EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage)
-        return None
+                out.aimed(self.rect.centerx, self.rect.centery, player)
 
 
 class Boss09_Bomber(BossEnemy):
@@ -743,9 +715,7 @@ class Boss09_Bomber(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.4)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (200, 80, 40), (size // 4, 0, size // 2, size))
-        pygame.draw.rect(self.image, (200, 80, 40), (0, size // 4, size, size // 2))
+        self.image = get_surface("cross", (size, size), (200, 80, 40))
         self.rect = self.image.get_rect(center=(x, y))
         self.drop_cooldown = max(40, 140 - difficulty_level * 4)
         self.timer = 0
@@ -754,15 +724,14 @@ class Boss09_Bomber(BossEnemy):
         self.display_name = "Bomber"
         self.projectile_damage = 2
 
-    def update(self, player):
+    def update(self, player, out):
         # drop slow-moving bombs downward (projectiles with angle ~90)
         self.timer += 1
         if self.timer >= self.drop_cooldown:
             self.timer = 0
             # bombs fall downwards: spawn a projectile with angle ~90 +/- 10 deg and higher damage
-            angle = 90 + random.uniform(-10, 10)
-            return EnemyProjectile(self.rect.centerx + random.randint(-20, 20), self.rect.centery, player, angle=angle, damage=self.projectile_damage + 1)
-        return None
+            angle = 90 + rng.uniform(-10, 10)
+            out.angled(self.rect.centerx + rng.randint(-20, 20), self.rect.centery, angle)
 
 
 class Boss10_PhaseWalker(BossEnemy):
@@ -770,8 +739,7 @@ class Boss10_PhaseWalker(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.0)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (100, 150, 255), (size // 2, size // 2), size // 2)
+        self.image = get_surface("circle", (size, size), (100, 150, 255))
         self.rect = self.image.get_rect(center=(x, y))
         self.tp_cooldown = max(60, 150 - difficulty_level * 4)
         self.tp_timer = 0
@@ -781,20 +749,17 @@ class Boss10_PhaseWalker(BossEnemy):
         self.display_name = "Phase Walker"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.tp_timer += 1
         if self.tp_timer >= self.tp_cooldown:
             self.tp_timer = 0
             # teleport to random on-screen location then fire a burst
-            nx = random.randint(100, 700)
-            ny = random.randint(100, 500)
+            nx = rng.randint(100, 700)
+            ny = rng.randint(100, 500)
             self.rect.center = (nx, ny)
-            bursts = []
             for i in range(self.tp_burst):
-                angle = random.uniform(-20, 20) + math.degrees(math.atan2(player.rect.centery - ny, player.rect.centerx - nx))
-                bursts.append(EnemyProjectile(nx, ny, player, angle=angle, damage=self.projectile_damage))
-            return bursts
-        return None
+                angle = rng.uniform(-20, 20) + math.degrees(math.atan2(player.rect.centery - ny, player.rect.centerx - nx))
+                out.angled(nx, ny, angle)
 
 
 class Boss11_Cycler(BossEnemy):
@@ -802,8 +767,7 @@ class Boss11_Cycler(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.6)
-        self.base_image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.base_image, (160, 100, 240), (size // 2, size // 2), size // 2)
+        self.base_image = get_surface("circle", (size, size), (160, 100, 240))
         self.rect = self.base_image.get_rect(center=(x, y))
         self.angle = 0
         self.shoot_cooldown = max(20, 50 - difficulty_level * 2)
@@ -811,20 +775,16 @@ class Boss11_Cycler(BossEnemy):
         self.max_health = int(30 * (1.2 ** difficulty_level))
         self.health = self.max_health
         self.display_name = "Cycler"
+        self.volley = Radial(6)
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         self.angle = (self.angle + 6) % 360
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
             # fire rotated volley (angles offset by cycle angle)
-            shots = []
-            for i in range(6):
-                angle = self.angle + i * (360 / 6)
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=angle, damage=self.projectile_damage))
-            return shots
-        return None
+            self.volley.fire(out, self.rect.centerx, self.rect.centery, turn=self.angle)
 
 
 class Boss12_Shifter(BossEnemy):
@@ -834,45 +794,40 @@ class Boss12_Shifter(BossEnemy):
         self.forms = [ (180, 60, 60), (60, 180, 60), (60, 60, 180), (180, 180, 60)]
         self.form = 0
         size = int(ENEMY_SIZE * 2.4)
-        self.base_image = pygame.Surface((size, size))
-        self.base_image.fill(self.forms[self.form])
+        self.base_image = get_surface("rect", (size, size), self.forms[self.form])
         self.rect = self.base_image.get_rect(center=(x, y))
         self.change_cooldown = max(80, 200 - difficulty_level * 6)
         self.timer = 0
         self.max_health = int(22 * (1.18 ** difficulty_level))
         self.health = self.max_health
         self.display_name = "Shifter"
+        self.burst = Radial(8)
+        self.cone = AimedSpread((-10, 0, 10))
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.timer >= self.change_cooldown:
             self.timer = 0
             # pick a new form and immediately fire a pattern based on it
-            self.form = random.randrange(len(self.forms))
-            self.base_image.fill(self.forms[self.form])
+            self.form = rng.randrange(len(self.forms))
+            self.base_image = get_surface("rect", self.base_image.get_size(), self.forms[self.form])
             # form actions:
             if self.form == 0:
                 # single strong shot
-                return EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage + 1)
+                out.aimed(self.rect.centerx, self.rect.centery, player)
+                return
             elif self.form == 1:
                 # short radial burst
-                shots = []
-                for a in range(8):
-                    angle = a * (360 / 8)
-                    shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=angle, damage=self.projectile_damage))
-                return shots
+                self.burst.fire(out, self.rect.centerx, self.rect.centery)
+                return
             elif self.form == 2:
                 # spawn a minion
-                return Enemy(self.rect.centerx + random.randint(-30,30), self.rect.centery + random.randint(-30,30))
+                out.spawn(Enemy(self.rect.centerx + rng.randint(-30,30), self.rect.centery + rng.randint(-30,30)))
+                return
             else:
                 # targeted 3-shot cone
-                shots = []
-                base_angle = math.degrees(math.atan2(player.rect.centery - self.rect.centery, player.rect.centerx - self.rect.centerx))
-                for a in (-10, 0, 10):
-                    shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=base_angle + a, damage=self.projectile_damage))
-                return shots
-        return None
+                self.cone.fire(out, self.rect.centerx, self.rect.centery, player)
 
 
 class Boss13_Spawner(BossEnemy):
@@ -880,8 +835,7 @@ class Boss13_Spawner(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.4)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((120, 80, 40))
+        self.image = get_surface("rect", (size, size), (120, 80, 40))
         self.rect = self.image.get_rect(center=(x, y))
         self.spawn_cooldown = max(60, 160 - difficulty_level * 6)
         self.timer = 0
@@ -890,22 +844,19 @@ class Boss13_Spawner(BossEnemy):
         self.display_name = "Spawner"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.timer >= self.spawn_cooldown:
             self.timer = 0
             # spawn 1-2 regular enemies near boss
-            spawns = []
-            count = 1 + (1 if random.random() < 0.4 else 0)
+            count = 1 + (1 if rng.random() < 0.4 else 0)
             for _ in range(count):
-                nx = self.rect.centerx + random.randint(-60, 60)
-                ny = self.rect.centery + random.randint(-60, 60)
+                nx = self.rect.centerx + rng.randint(-60, 60)
+                ny = self.rect.centery + rng.randint(-60, 60)
                 e = Enemy(nx, ny)
                 e.max_health = max(1, int(e.max_health * (1 + (self.boss_stage if hasattr(self,'boss_stage') else 0)*0.2)))
                 e.health = e.max_health
-                spawns.append(e)
-            return spawns
-        return None
+                out.spawn(e)
 
 
 class Boss14_Blazer(BossEnemy):
@@ -913,8 +864,7 @@ class Boss14_Blazer(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.0)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((240, 140, 40))
+        self.image = get_surface("rect", (size, size), (240, 140, 40))
         self.rect = self.image.get_rect(center=(x, y))
         self.stream_rate = max(4, 12 - difficulty_level)
         self.timer = 0
@@ -922,24 +872,16 @@ class Boss14_Blazer(BossEnemy):
         self.health = self.max_health
         self.display_name = "Blazer"
         self.projectile_damage = 1
-        self.stream_active = False
-        self.stream_duration = 60
-        self.stream_tick = 0
+        self.stream = Stream(self.stream_rate, 60)
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
-        if not self.stream_active and self.timer >= 120:
-            self.stream_active = True
-            self.stream_tick = 0
+        if not self.stream.active and self.timer >= 120:
+            self.stream.start()
             self.timer = 0
-        if self.stream_active:
-            self.stream_tick += 1
-            # fire small fast projectiles every few frames
-            if self.stream_tick % self.stream_rate == 0:
-                return EnemyProjectile(self.rect.centerx + random.randint(-10,10), self.rect.centery, player, damage=self.projectile_damage)
-            if self.stream_tick >= self.stream_duration:
-                self.stream_active = False
-        return None
+        # fire small fast projectiles every few frames
+        if self.stream.step():
+            out.aimed(self.rect.centerx + rng.randint(-10,10), self.rect.centery, player)
 
 
 class Boss15_FrostKing(BossEnemy):
@@ -947,17 +889,17 @@ class Boss15_FrostKing(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 3.2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (150, 220, 255), (size // 2, size // 2), size // 2)
+        self.image = get_surface("circle", (size, size), (150, 220, 255))
         self.rect = self.image.get_rect(center=(x, y))
         self.freeze_radius = 100 + difficulty_level * 5
         self.max_health = int(28 * (1.2 ** difficulty_level))
         self.health = self.max_health
         self.timer = 0
         self.display_name = "Frost King"
+        self.shards = AimedSpread((-12, 0, 12))
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         # aura: if player within radius, apply slow
         px, py = player.rect.center
         bx, by = self.rect.center
@@ -968,12 +910,7 @@ class Boss15_FrostKing(BossEnemy):
         self.timer += 1
         if self.timer >= 80:
             self.timer = 0
-            shots = []
-            for a in (-12, 0, 12):
-                base_angle = math.degrees(math.atan2(player.rect.centery - by, player.rect.centerx - bx))
-                shots.append(EnemyProjectile(bx, by, player, angle=base_angle + a, damage=self.projectile_damage))
-            return shots
-        return None
+            self.shards.fire(out, bx, by, player)
 
 
 class Boss16_Stormer(BossEnemy):
@@ -981,8 +918,7 @@ class Boss16_Stormer(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.6)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((230, 230, 80))
+        self.image = get_surface("rect", (size, size), (230, 230, 80))
         self.rect = self.image.get_rect(center=(x, y))
         self.chain_rate = max(40, 110 - difficulty_level * 4)
         self.timer = 0
@@ -991,17 +927,14 @@ class Boss16_Stormer(BossEnemy):
         self.display_name = "Stormer"
         self.projectile_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.timer >= self.chain_rate:
             self.timer = 0
             # quick burst of nearby angled projectiles to simulate chain lightning
-            shots = []
             for i in range(6):
-                angle = math.degrees(math.atan2(player.rect.centery - self.rect.centery, player.rect.centerx - self.rect.centerx)) + random.uniform(-25,25)
-                shots.append(EnemyProjectile(self.rect.centerx + random.randint(-20,20), self.rect.centery + random.randint(-20,20), player, angle=angle, damage=self.projectile_damage))
-            return shots
-        return None
+                angle = math.degrees(math.atan2(player.rect.centery - self.rect.centery, player.rect.centerx - self.rect.centerx)) + rng.uniform(-25,25)
+                out.angled(self.rect.centerx + rng.randint(-20,20), self.rect.centery + rng.randint(-20,20), angle)
 
 
 class Boss17_Titan(BossEnemy):
@@ -1009,8 +942,7 @@ class Boss17_Titan(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 3.6)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((160, 30, 30))
+        self.image = get_surface("rect", (size, size), (160, 30, 30))
         self.rect = self.image.get_rect(center=(x, y))
         self.shoot_cooldown = max(50, 140 - difficulty_level * 3)
         self.timer = 0
@@ -1019,13 +951,12 @@ class Boss17_Titan(BossEnemy):
         self.display_name = "Titan"
         self.projectile_damage = 3
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
             # heavy slow projectile (higher damage)
-            return EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage + 2)
-        return None
+            out.aimed(self.rect.centerx, self.rect.centery, player)
 
 
 class Boss18_Phantom(BossEnemy):
@@ -1033,8 +964,7 @@ class Boss18_Phantom(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 2.4)
-        self.base_image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.base_image, (110, 110, 140), (size // 2, size // 2), size // 2)
+        self.base_image = get_surface("circle", (size, size), (110, 110, 140))
         self.rect = self.base_image.get_rect(center=(x, y))
         self.alpha = 255
         self.fade_dir = -5
@@ -1043,13 +973,14 @@ class Boss18_Phantom(BossEnemy):
         self.max_health = int(18 * (1.18 ** difficulty_level))
         self.health = self.max_health
         self.display_name = "Phantom"
+        self.bolts = AimedSpread((-6, 6))
         self.projectile_damage = 1
         self.phase = False
         self.phase_timer = 0
         self.phase_duration = 40
         self.phase_cooldown = 120
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         # fade alpha and toggle intangible phases
         if self.timer >= self.phase_cooldown:
@@ -1060,20 +991,15 @@ class Boss18_Phantom(BossEnemy):
             self.phase_timer += 1
             # teleport slightly while phased
             if self.phase_timer % 10 == 0:
-                self.rect.centerx += random.randint(-40, 40)
-                self.rect.centery += random.randint(-30, 30)
+                self.rect.centerx += rng.randint(-40, 40)
+                self.rect.centery += rng.randint(-30, 30)
             if self.phase_timer >= self.phase_duration:
                 self.phase = False
                 self.phase_timer = 0
 
         if self.timer % self.shoot_cooldown == 0:
             # shoot a pair of slightly offset piercing bolts
-            shots = []
-            base_angle = math.degrees(math.atan2(player.rect.centery - self.rect.centery, player.rect.centerx - self.rect.centerx))
-            shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=base_angle - 6, damage=self.projectile_damage))
-            shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=base_angle + 6, damage=self.projectile_damage))
-            return shots
-        return None
+            self.bolts.fire(out, self.rect.centerx, self.rect.centery, player)
 
 
 class Boss19_Colossus(BossEnemy):
@@ -1081,18 +1007,19 @@ class Boss19_Colossus(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 3.2)
-        self.image = pygame.Surface((size, size))
-        self.image.fill((80, 40, 120))
+        self.image = get_surface("rect", (size, size), (80, 40, 120))
         self.rect = self.image.get_rect(center=(x, y))
         self.max_health = int(60 * (1.25 ** difficulty_level))
         self.health = self.max_health
         self.phase = 1
         self.timer = 0
         self.display_name = "Colossus"
+        self.spread = AimedSpread((-12, 0, 12))
+        self.slam = Radial(12)
         self.projectile_damage = 2
         self.phase_changed = False
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         # change phase when health crosses thresholds
         ratio = self.health / self.max_health
@@ -1103,21 +1030,15 @@ class Boss19_Colossus(BossEnemy):
 
         if self.phase == 1 and self.timer % 90 == 0:
             # single heavy projectile
-            return EnemyProjectile(self.rect.centerx, self.rect.centery, player, damage=self.projectile_damage + 1)
+            out.aimed(self.rect.centerx, self.rect.centery, player)
+            return
         elif self.phase == 2 and self.timer % 60 == 0:
             # fire three spread shots
-            shots = []
-            base_angle = math.degrees(math.atan2(player.rect.centery - self.rect.centery, player.rect.centerx - self.rect.centerx))
-            for a in (-12, 0, 12):
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=base_angle + a, damage=self.projectile_damage + 1))
-            return shots
+            self.spread.fire(out, self.rect.centerx, self.rect.centery, player)
+            return
         elif self.phase == 3 and self.timer % 40 == 0:
             # radial slam
-            shots = []
-            for i in range(12):
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=i * (360 / 12), damage=self.projectile_damage + 1))
-            return shots
-        return None
+            self.slam.fire(out, self.rect.centerx, self.rect.centery)
 
 
 class Boss20_OmegaCore(BossEnemy):
@@ -1125,19 +1046,19 @@ class Boss20_OmegaCore(BossEnemy):
     def __init__(self, x, y, difficulty_level):
         super().__init__(x, y, difficulty_level)
         size = int(ENEMY_SIZE * 3.8)
-        self.base_image = pygame.Surface((size, size))
-        self.base_image.fill((30, 10, 40))
+        self.base_image = get_surface("rect", (size, size), (30, 10, 40))
         self.rect = self.base_image.get_rect(center=(x, y))
         self.timer = 0
         self.max_health = int(80 * (1.3 ** difficulty_level))
         self.health = self.max_health
         self.display_name = "Omega Core"
+        self.barrage = Radial(16)
         self.projectile_damage = 3
         self.phase_timer = 0
         self.phase = 0
         self.attack_cycle = 0
 
-    def update(self, player):
+    def update(self, player, out):
         self.timer += 1
         self.phase_timer += 1
         # Cycle through a set of attack phases: radial -> minions -> targeted storm
@@ -1147,29 +1068,22 @@ class Boss20_OmegaCore(BossEnemy):
 
         if self.phase == 0 and self.timer % 40 == 0:
             # radial barrage
-            shots = []
-            count = 16
-            for i in range(count):
-                shots.append(EnemyProjectile(self.rect.centerx, self.rect.centery, player, angle=i * (360 / count), damage=self.projectile_damage))
-            return shots
+            self.barrage.fire(out, self.rect.centerx, self.rect.centery)
+            return
         elif self.phase == 1 and self.timer % 90 == 0:
             # spawn multiple mid-health minions (Shooters)
-            spawns = []
             for i in range(2 + (self.boss_stage // 3 if hasattr(self,'boss_stage') else 0)):
-                sx = self.rect.centerx + random.randint(-80, 80)
-                sy = self.rect.centery + random.randint(-80, 80)
+                sx = self.rect.centerx + rng.randint(-80, 80)
+                sy = self.rect.centery + rng.randint(-80, 80)
                 s = ShooterEnemy(sx, sy)
                 s.max_health = max(1, int(s.max_health * (1 + (self.boss_stage if hasattr(self,'boss_stage') else 0)*0.2)))
                 s.health = s.max_health
-                spawns.append(s)
-            return spawns
+                out.spawn(s)
+            return
         elif self.phase == 2 and self.timer % 20 == 0:
             # targeted nano-storm: many small shots at player
-            shots = []
             for _ in range(3 + (self.boss_stage // 2 if hasattr(self,'boss_stage') else 0)):
-                shots.append(EnemyProjectile(self.rect.centerx + random.randint(-20,20), self.rect.centery + random.randint(-20,20), player, damage=self.projectile_damage))
-            return shots
-        return None
+                out.aimed(self.rect.centerx + rng.randint(-20,20), self.rect.centery + rng.randint(-20,20), player)
 
 
 # --- Utility: create boss instance by index (0-based) ---
@@ -1194,18 +1108,32 @@ def create_boss_by_index(index, x, y, difficulty_level, boss_stage=0):
 
 # --- GameEvent and AirstrikeEvent (unchanged except small bomb damage set) ---
 class GameEvent:
-    """Base class for time-limited game events."""
+    """
+    Base class for time-limited game events, run by a room's
+    events.EventScheduler: tick() once per simulated frame, render() from
+    the draw pass (any number of times, or never when headless).
+    """
 
     def __init__(self):
         self.active = True
 
-    def update(self, screen, player, enemy_group, particle_group):
+    def tick(self, player, enemy_index, particles):
+        """Advance one frame. enemy_index: SpatialHash over the room's enemies, fresh for this frame."""
         raise NotImplementedError("Must be implemented by subclass")
 
+    def render(self, screen):
+        """Draw the current state without changing it."""
+
+    def hibernate(self):
+        """Drop render caches before the room is hibernated; render() rebuilds them."""
+
+
+# file and on-screen size of the airstrike plane; preload it with assets.preload
+PLANE_IMAGE = ("plane.png", (100, 50))
+
 
 class AirstrikeEvent(GameEvent):
-    # Takes pygame as an argument for image loading (passed from main)
-    def __init__(self, width, height, player_x, player_y, pygame_instance, duration=300):
+    def __init__(self, width, height, player_x, player_y, duration=300):
         super().__init__()
         self.width = width
         self.height = height
@@ -1237,21 +1165,36 @@ class AirstrikeEvent(GameEvent):
         self.end_x = self.start_x + self.dx * projection_factor
         self.end_y = self.start_y + self.dy * projection_factor
 
-        # --- IMAGE LOADING WITH ROTATION ---
-        try:
-            self.base_image = pygame_instance.image.load("plane.png").convert_alpha()
-            self.base_image = pygame_instance.transform.scale(self.base_image, (100, 50))
-        except pygame_instance.error:
-            self.base_image = pygame_instance.Surface((100, 50))
-            self.base_image.fill((100, 100, 100))
-
-        self.rotated_image = pygame_instance.transform.rotate(self.base_image, -self.angle_degrees)
+        # --- IMAGE (shared, pre-scaled and pre-rotated by the asset cache) ---
+        self.rotated_image = load_image(*PLANE_IMAGE, angle=self.angle_degrees)
 
         # Bomb properties
         self.bomb_radius = 30
         self.bomb_interval = 50  # drop every N pixels of travel
         self.bomb_timer = 0
         self.bombs = []
+        self.explosions = []  # (x, y, r) of bombs that went off this tick
+        self.warning_layer = None  # (Surface, topleft), rasterized on first render
+
+        # plane center while flying
+        self.x = self.start_x
+        self.y = self.start_y
+
+    def warning_overlay(self, screen):
+        """
+        The dotted warning line, drawn once onto a screen-sized layer and
+        cropped to what it covers, so each warning frame is a single blit.
+        """
+        if self.warning_layer is None:
+            layer = new_surface(screen.get_size(), pygame.SRCALPHA)
+            self.draw_dotted_line(layer, WARNING_LINE_COLOR, (self.start_x, self.start_y),
+                                  (int(self.end_x), int(self.end_y)))
+            area = layer.get_bounding_rect()
+            self.warning_layer = (layer.subsurface(area).copy(), area.topleft)
+        return self.warning_layer
+
+    def hibernate(self):
+        self.warning_layer = None
 
     def draw_dotted_line(self, screen, color, start_pos, end_pos, dash_length=10, gap_length=5):
         """Draws a dotted line between two points."""
@@ -1288,32 +1231,24 @@ class AirstrikeEvent(GameEvent):
             current_pos[1] = dash_end_y + unit_dy * gap_length
 
 
-    def update(self, screen, player, enemy_group, particle_group):
+    def tick(self, player, enemy_index, particles):
         if self.frame >= self.duration:
             self.active = False
             return
 
         self.frame += 1
+        self.explosions = []
 
         # --- WARNING PHASE ---
         if self.frame <= self.warning_frames:
-            self.draw_dotted_line(
-                screen,
-                WARNING_LINE_COLOR,
-                (self.start_x, self.start_y),
-                (int(self.end_x), int(self.end_y))
-            )
             return
 
         # --- FLIGHT PHASE ---
         self.started_flight = True
         flight_frame = self.frame - self.warning_frames
 
-        x = self.start_x + flight_frame * self.speed * self.dx
-        y = self.start_y + flight_frame * self.speed * self.dy
-
-        plane_rect = self.rotated_image.get_rect(center=(int(x), int(y)))
-        screen.blit(self.rotated_image, plane_rect)
+        x = self.x = self.start_x + flight_frame * self.speed * self.dx
+        y = self.y = self.start_y + flight_frame * self.speed * self.dy
 
         # Drop bombs
         self.bomb_timer += self.speed
@@ -1330,63 +1265,58 @@ class AirstrikeEvent(GameEvent):
         for bomb in list(self.bombs):
             bomb["timer"] -= 1
 
-            # Draw falling bomb
-            if bomb["timer"] > 10:
-                pygame.draw.circle(
-                    screen,
-                    (255, 200, 0),
-                    (int(bomb["x"]), int(bomb["y"])),
-                    6
-                )
-
-            # Draw warning circle
-            if bomb["timer"] > 0 and bomb["timer"] <= 30:
-                warning_radius = int(bomb["r"] * (30 - bomb["timer"]) / 30)
-                pygame.draw.circle(
-                    screen,
-                    (255, 100, 100),
-                    (int(bomb["x"]), int(bomb["y"])),
-                    warning_radius,
-                    1
-                )
-
             # Explosion
             if bomb["timer"] <= 0:
                 bx, by = bomb["x"], bomb["y"]
-
-                # Explosion visual
-                pygame.draw.circle(
-                    screen,
-                    (255, 100, 0),
-                    (int(bx), int(by)),
-                    bomb["r"],
-                    2
-                )
+                self.explosions.append((bx, by, bomb["r"]))
 
                 # Add particles
-                for _ in range(10):
-                    particle_group.add(Particle(int(bx), int(by)))
+                particles.emit(int(bx), int(by), 10)
 
                 # Damage enemies
-                for enemy in list(enemy_group):
-                    ex, ey = enemy.rect.center
-                    if ((bx - ex) ** 2 + (by - ey) ** 2) ** 0.5 <= bomb["r"]:
-                        if enemy.take_hit():
-                            enemy.kill()
+                for enemy in enemy_index.query_radius((bx, by), bomb["r"]):
+                    if enemy.take_hit():
+                        enemy.kill()
 
                 # Damage player - USE take_damage with moderate bomb damage
                 px, py = player.rect.center
-                if ((bx - px) ** 2 + (by - py) ** 2) ** 0.5 <= bomb["r"]:
+                if (bx - px) ** 2 + (by - py) ** 2 <= bomb["r"] ** 2:
                     player.take_damage(source_center_x=bx, source_center_y=by, damage=2)
 
                 # Remove bomb after explosion
                 self.bombs.remove(bomb)
 
+    def render(self, screen):
+        # --- WARNING PHASE ---
+        if not self.started_flight:
+            screen.blit(*self.warning_overlay(screen))
+            return
+
+        # --- FLIGHT PHASE ---
+        plane_rect = self.rotated_image.get_rect(center=(int(self.x), int(self.y)))
+        screen.blit(self.rotated_image, plane_rect)
+
+        # circles come pre-rendered from the atlas, one per radius
+        for bomb in self.bombs:
+            center = (int(bomb["x"]), int(bomb["y"]))
+            # Draw falling bomb
+            if bomb["timer"] > 10:
+                blit_circle(screen, "disc", (255, 200, 0), center, 6)
+
+            # Draw warning circle
+            if bomb["timer"] > 0 and bomb["timer"] <= 30:
+                warning_radius = int(bomb["r"] * (30 - bomb["timer"]) / 30)
+                blit_circle(screen, "ring", (255, 100, 100), center, warning_radius)
+
+        # Explosion visual
+        for bx, by, r in self.explosions:
+            blit_circle(screen, "ring2", (255, 100, 0), (int(bx), int(by)), r)
+
 
 class ShooterEnemy(Enemy):
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image.fill((200, 50, 200))
+        self.image = self.tinted((200, 50, 200))
         self.shoot_cooldown = 90
         self.timer = 0
         self.max_health = 3
@@ -1394,36 +1324,35 @@ class ShooterEnemy(Enemy):
         self.contact_damage = 1
         self.projectile_damage = 1
 
-    def update(self, player):
-        super().update(player)
+    def think(self, player, out):
+        super().think(player, out)
         self.timer += 1
         if self.timer >= self.shoot_cooldown:
             self.timer = 0
-            return EnemyProjectile(self.rect.centerx, self.rect.centery, player)
-        return None
+            out.aimed(self.rect.centerx, self.rect.centery, player)
 
 
 class JumperEnemy(Enemy):
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image.fill((50, 200, 50))
-        self.jump_cooldown = random.randint(120, 180)
+        self.image = self.tinted((50, 200, 50))
+        self.jump_cooldown = rng.randint(120, 180)
         self.timer = 0
         self.target = None
         self.max_health = 2
         self.health = self.max_health
         self.contact_damage = 1
 
-    def update(self, player):
+    def update(self, player, out):
         if self.flash_timer > 0:
             self.flash_timer -= 1
             if self.flash_timer == 0:
-                self.image.fill((50, 200, 50))
+                self.image = self.tinted((50, 200, 50))
 
         self.timer += 1
         if self.timer >= self.jump_cooldown:
             self.timer = 0
-            self.jump_cooldown = random.randint(120, 180)
+            self.jump_cooldown = rng.randint(120, 180)
             self.target = player.rect.center
 
         if self.target:
@@ -1435,39 +1364,3 @@ class JumperEnemy(Enemy):
             self.rect.y += int(speed * dy / dist)
             if abs(dx) < 10 and abs(dy) < 10:
                 self.target = None
-        return None
-
-
-class EnemyProjectile(pygame.sprite.Sprite):
-    def __init__(self, x, y, player, angle=None, damage=1):
-        super().__init__()
-        self.image = pygame.Surface((8, 8))
-        self.image.fill((255, 150, 0))
-        self.rect = self.image.get_rect(center=(x, y))
-
-        self.pos_x = float(self.rect.centerx)
-        self.pos_y = float(self.rect.centery)
-
-        speed = 5.0
-
-        if angle is not None:
-            rad = math.radians(angle)
-            self.dx = speed * math.cos(rad)
-            self.dy = speed * math.sin(rad)
-        else:
-            dx = player.rect.centerx - x
-            dy = player.rect.centery - y
-            dist = max(1.0, math.hypot(dx, dy))
-            self.dx = speed * dx / dist
-            self.dy = speed * dy / dist
-
-        # Damage this projectile does on hit
-        self.damage = damage
-
-    def update(self, walls=None):
-        self.pos_x += self.dx
-        self.pos_y += self.dy
-        self.rect.centerx = int(self.pos_x)
-        self.rect.centery = int(self.pos_y)
-        if walls and pygame.sprite.spritecollideany(self, walls):
-            self.kill()
@@ -0,0 +1,142 @@
+# profiler.py  (per-phase frame timing, rolling percentiles, overlay and export)
+import csv
+import json
+from collections import deque
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from assets import count_allocation, new_surface
+
+PHASES = ("input", "update", "collisions", "draw", "flip")
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Wall time per main-loop phase, in milliseconds.
+    Call start_frame(), then phase(name) whenever the loop moves on to another
+    phase, then end_frame(). Time between phase() calls is charged to the open
+    phase, and a phase entered twice in a frame accumulates. The last `window`
+    frames feed the rolling percentiles and the last `history` frames are kept
+    for export.
+    """
+
+    def __init__(self, window=600, history=3600):
+        self.window = window
+        self.frames = deque(maxlen=history)  # (frame number, ms per phase...)
+        self.frame_count = 0
+        self._times = dict.fromkeys(PHASES, 0.0)
+        self._open = None
+        self._since = 0.0
+
+    def start_frame(self):
+        times = self._times
+        for name in times:
+            times[name] = 0.0
+        self._open = None
+
+    def phase(self, name):
+        now = perf_counter()
+        if self._open is not None:
+            self._times[self._open] += now - self._since
+        self._open = name
+        self._since = now
+
+    def end_frame(self):
+        self.phase(None)
+        self.frame_count += 1
+        times = self._times
+        self.frames.append((self.frame_count,) + tuple(times[name] * 1000.0 for name in PHASES))
+
+    def _recent(self):
+        n = min(self.window, len(self.frames))
+        if not n:
+            return None
+        rows = np.array(list(islice(self.frames, len(self.frames) - n, None)))
+        ms = rows[:, 1:]
+        # last column: the whole frame
+        return np.column_stack((ms, ms.sum(axis=1)))
+
+    def stats(self):
+        """{phase: {"p50", "p95", "p99", "mean", "max"}} over the rolling window, plus "total"."""
+        ms = self._recent()
+        if ms is None:
+            return {}
+        pct = np.percentile(ms, PERCENTILES, axis=0)
+        out = {}
+        for col, name in enumerate(PHASES + ("total",)):
+            entry = {f"p{p}": float(pct[k, col]) for k, p in enumerate(PERCENTILES)}
+            entry["mean"] = float(ms[:, col].mean())
+            entry["max"] = float(ms[:, col].max())
+            out[name] = entry
+        return out
+
+    # --- Export ---
+    def export_csv(self, path):
+        """One row per kept frame: frame, ms per phase, total."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + PHASES + ("total",))
+            for row in self.frames:
+                writer.writerow(row + (sum(row[1:]),))
+
+    def export_json(self, path):
+        """Rolling-window stats plus every kept frame."""
+        data = {
+            "phases": list(PHASES),
+            "window": self.window,
+            "stats": self.stats(),
+            "frames": [list(row) for row in self.frames],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+
+class ProfilerOverlay:
+    """
+    Translucent p50/p95/p99 table in the top-right corner.
+    The panel is re-rendered every `refresh` frames and blitted in between.
+    """
+
+    def __init__(self, profiler, font, refresh=30):
+        self.profiler = profiler
+        self.font = font
+        self.refresh = refresh
+        self.visible = False
+        self.panel = None
+        self.age = refresh
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.age = self.refresh
+
+    def _render(self, extra_lines):
+        stats = self.profiler.stats()
+        lines = ["phase        p50    p95    p99 ms"]
+        for name in PHASES + ("total",):
+            s = stats.get(name)
+            if s:
+                lines.append(f"{name:<10} {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f}")
+        lines.extend(extra_lines)
+        rendered = [self.font.render(line, True, (230, 230, 230)) for line in lines]
+        count_allocation(len(rendered))
+        line_h = self.font.get_linesize()
+        w = max(r.get_width() for r in rendered) + 12
+        panel = new_surface((w, line_h * len(rendered) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, r in enumerate(rendered):
+            panel.blit(r, (6, 4 + i * line_h))
+        return panel
+
+    def draw(self, screen, extra_lines=()):
+        """Returns the blitted rect, or None while hidden."""
+        if not self.visible:
+            return None
+        self.age += 1
+        if self.panel is None or self.age >= self.refresh:
+            self.age = 0
+            self.panel = self._render(extra_lines)
+        return screen.blit(self.panel, (screen.get_width() - self.panel.get_width() - 8, 8))
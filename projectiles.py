@@ -0,0 +1,232 @@
+# projectiles.py  (pooled, array-backed projectile store)
+import numpy as np
+import pygame
+
+
+class ProjectileStore:
+    """
+    Structure-of-arrays pool of live projectiles.
+    Every column is a NumPy array indexed by slot; dead slots go on a free list
+    and are reused by the next spawn. update() moves, ages and wall-tests every
+    projectile in one vectorized pass, and draw() blits shared images instead of
+    keeping a Surface per bullet.
+
+    Rect semantics follow the old per-bullet sprites: the rect has the size of
+    the projectile's image and is centered on the truncated float position.
+
+    max_live: optional cap on live rows; spawning past it retires the oldest.
+    """
+
+    def __init__(self, capacity=64, max_live=None):
+        self.max_live = max_live
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.fly_time = np.zeros(capacity, dtype=np.int32)  # 0 = no time limit
+        self.w = np.zeros(capacity, dtype=np.int64)
+        self.h = np.zeros(capacity, dtype=np.int64)
+        self.hw = np.zeros(capacity, dtype=np.int64)  # w // 2
+        self.hh = np.zeros(capacity, dtype=np.int64)  # h // 2
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.hits_left = np.zeros(capacity, dtype=np.int32)
+        self.explosive = np.zeros(capacity, dtype=np.int32)
+        self.image_id = np.zeros(capacity, dtype=np.int32)
+        self.seq = np.zeros(capacity, dtype=np.int64)  # spawn order
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.free = list(range(capacity - 1, -1, -1))
+        self.count = 0
+        self.next_seq = 0
+        self.top = 0  # one past the highest slot ever used; vector work stops here
+
+        # shared images, one per distinct look
+        self.images = []
+        self.image_ids = {}
+
+    _COLUMNS = ("x", "y", "dx", "dy", "age", "fly_time", "w", "h", "hw", "hh", "damage",
+                "hits_left", "explosive", "image_id", "seq", "alive")
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.alive)
+
+    def _grow(self):
+        old = self.capacity
+        new = old * 2
+        for name in self._COLUMNS:
+            col = getattr(self, name)
+            grown = np.zeros(new, dtype=col.dtype)
+            grown[:old] = col
+            setattr(self, name, grown)
+        self.free.extend(range(new - 1, old - 1, -1))
+
+    def _image_id(self, image):
+        key = id(image)
+        iid = self.image_ids.get(key)
+        if iid is None:
+            iid = len(self.images)
+            self.images.append(image)
+            self.image_ids[key] = iid
+        return iid
+
+    def spawn(self, x, y, dx, dy, image, fly_time=0, damage=1, hits_left=1, explosive=0):
+        """Place one projectile centered on (x, y). Returns its slot."""
+        cap = self.max_live
+        if cap is not None and self.count >= cap:
+            self._release(self.live()[:self.count - cap + 1])
+        if not self.free:
+            self._grow()
+        i = self.free.pop()
+        w, h = image.get_size()
+        # the old sprites snapped to their integer rect center before moving
+        self.x[i] = int(x)
+        self.y[i] = int(y)
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.age[i] = 0
+        self.fly_time[i] = fly_time
+        self.w[i] = w
+        self.h[i] = h
+        self.hw[i] = w // 2
+        self.hh[i] = h // 2
+        self.damage[i] = damage
+        self.hits_left[i] = hits_left
+        self.explosive[i] = explosive
+        self.image_id[i] = self._image_id(image)
+        self.seq[i] = self.next_seq
+        self.next_seq += 1
+        self.alive[i] = True
+        self.count += 1
+        if i >= self.top:
+            self.top = i + 1
+        return i
+
+    def spawn_many(self, x, y, dx, dy, image, damage, fly_time=0):
+        """
+        Place len(x) projectiles sharing one image, in order, as repeated
+        spawn() calls would: same slots, same seq numbers. damage is an array.
+        """
+        cap = self.max_live
+        if cap is not None and self.count + len(x) > cap:
+            if len(x) > cap:
+                x, y, dx, dy, damage = x[-cap:], y[-cap:], dx[-cap:], dy[-cap:], damage[-cap:]
+            self._release(self.live()[:self.count + len(x) - cap])
+        n = len(x)
+        if not n:
+            return
+        while len(self.free) < n:
+            self._grow()
+        idx = np.array(self.free[:-n - 1:-1], dtype=np.int64)
+        del self.free[-n:]
+        w, h = image.get_size()
+        # the old sprites snapped to their integer rect center before moving
+        self.x[idx] = np.trunc(x)
+        self.y[idx] = np.trunc(y)
+        self.dx[idx] = dx
+        self.dy[idx] = dy
+        self.age[idx] = 0
+        self.fly_time[idx] = fly_time
+        self.w[idx] = w
+        self.h[idx] = h
+        self.hw[idx] = w // 2
+        self.hh[idx] = h // 2
+        self.damage[idx] = damage
+        self.hits_left[idx] = 1
+        self.explosive[idx] = 0
+        self.image_id[idx] = self._image_id(image)
+        self.seq[idx] = np.arange(self.next_seq, self.next_seq + n)
+        self.next_seq += n
+        self.alive[idx] = True
+        self.count += n
+        self.top = max(self.top, int(idx.max()) + 1)
+
+    def add(self, proj):
+        """Spawn from a Projectile record."""
+        return self.spawn(proj.pos_x, proj.pos_y, proj.dx, proj.dy, proj.image,
+                          fly_time=proj.fly_time, damage=proj.damage,
+                          hits_left=proj.hits_left, explosive=proj.explosive)
+
+    def kill(self, i):
+        if self.alive[i]:
+            self.alive[i] = False
+            self.free.append(int(i))
+            self.count -= 1
+
+    def _release(self, idx):
+        if len(idx):
+            self.alive[idx] = False
+            self.free.extend(idx.tolist())
+            self.count -= len(idx)
+
+    def empty(self):
+        self._release(np.flatnonzero(self.alive[:self.top]))
+
+    def _bounds(self):
+        n = self.top
+        # astype truncates toward zero, like int() on the old float positions
+        left = self.x[:n].astype(np.int64) - self.hw[:n]
+        top = self.y[:n].astype(np.int64) - self.hh[:n]
+        return left, top, left + self.w[:n], top + self.h[:n]
+
+    def update(self, walls=None, bounds=None):
+        """
+        Move and age every projectile; kill those that expire, those that hit
+        a wall (given a spatial.WallMap), and those wholly outside bounds
+        (left, top, right, bottom) when given.
+        """
+        if not self.count:
+            return
+        n = self.top
+        self.age[:n] += 1
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+
+        fly_time = self.fly_time[:n]
+        dead = (fly_time > 0) & (self.age[:n] >= fly_time)
+        if walls is not None or bounds is not None:
+            left, top, right, bottom = self._bounds()
+            if walls is not None:
+                dead |= walls.collide_rects(left, top, right, bottom)
+            if bounds is not None:
+                bl, bt, br, bb = bounds
+                dead |= (right <= bl) | (left >= br) | (bottom <= bt) | (top >= bb)
+        self._release(np.flatnonzero(dead & self.alive[:n]))
+
+    def live(self):
+        """Live slots in spawn order."""
+        idx = np.flatnonzero(self.alive[:self.top])
+        return idx[np.argsort(self.seq[idx], kind="stable")]
+
+    def rect(self, i):
+        w = int(self.w[i])
+        h = int(self.h[i])
+        return pygame.Rect(int(self.x[i]) - w // 2, int(self.y[i]) - h // 2, w, h)
+
+    def center(self, i):
+        return int(self.x[i]), int(self.y[i])
+
+    def collide_rect(self, rect):
+        """Live slots whose rect collides with rect, in spawn order."""
+        if not self.count:
+            return []
+        left, top, right, bottom = self._bounds()
+        hit = ((left < rect.right) & (right > rect.left) &
+               (top < rect.bottom) & (bottom > rect.top) & self.alive[:self.top])
+        idx = np.flatnonzero(hit)
+        return idx[np.argsort(self.seq[idx], kind="stable")].tolist()
+
+    def draw(self, surface, dirty=False):
+        """Blit every live row; with dirty=True return the blitted rects."""
+        if not self.count:
+            return []
+        idx = np.flatnonzero(self.alive[:self.top])
+        left, top, _, _ = self._bounds()
+        images = self.images
+        return surface.blits([(images[k], (l, t)) for k, l, t in
+                       zip(self.image_id[idx].tolist(), left[idx].tolist(), top[idx].tolist())],
+                      doreturn=dirty)
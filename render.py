@@ -0,0 +1,84 @@
+# render.py  (frame presentation: full repaint or dirty rectangles)
+import pygame
+
+
+class FullRenderer:
+    """Default: repaint the whole screen and flip every frame."""
+
+    dirty = False  # callers can skip collecting rects
+
+    def __init__(self, screen, background_color):
+        self.screen = screen
+        self.background_color = background_color
+
+    def begin(self, room):
+        self.screen.blit(room.wall_layer(self.background_color), (0, 0))
+
+    def mark(self, rect):
+        return rect
+
+    def mark_all(self, rects):
+        pass
+
+    def invalidate(self):
+        pass
+
+    def end(self):
+        pygame.display.flip()
+
+
+class DirtyRenderer:
+    """
+    Optional renderer for low-power machines.
+    The static room layer (floor colour and walls, pre-rendered per room
+    layout) is the background.
+    Each frame only the rects drawn last frame are restored from it, and only
+    last frame's and this frame's rects are pushed with display.update(rects).
+    Callers report what they drew with mark()/mark_all(), or invalidate() when
+    something was drawn that cannot be bounded (e.g. an airstrike line).
+    """
+
+    dirty = True
+
+    def __init__(self, screen, background_color):
+        self.screen = screen
+        self.background_color = background_color
+        self.background = None
+        self.prev = []
+        self.cur = []
+        self.full = True
+
+    def begin(self, room):
+        # a different layer object means the doors opened or the layout changed
+        background = room.wall_layer(self.background_color)
+        if background is not self.background:
+            self.background = background
+            self.full = True
+        screen = self.screen
+        if self.full:
+            screen.blit(background, (0, 0))
+        else:
+            for r in self.prev:
+                screen.blit(background, r, r)
+        self.cur = []
+
+    def mark(self, rect):
+        if rect is not None:
+            self.cur.append(rect)
+        return rect
+
+    def mark_all(self, rects):
+        self.cur.extend(rects)
+
+    def invalidate(self):
+        self.full = True
+
+    def end(self):
+        if self.full:
+            pygame.display.update()
+            # restore everything next frame so nothing drawn this frame lingers
+            self.cur = [self.screen.get_rect()]
+            self.full = False
+        else:
+            pygame.display.update(self.prev + self.cur)
+        self.prev = self.cur
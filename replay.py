@@ -0,0 +1,154 @@
+# replay.py  (compact input-log replays, re-simulated headless)
+#
+# python replay.py run.rpl           re-simulate and check the recorded result
+import struct
+import sys
+import time
+
+from game import Simulation, FrameInput, INPUT_KEYS
+
+MAGIC = b"DRPL"
+# bumped whenever the same seed and inputs stop producing the same run
+# (2: rooms are generated ahead of time, which moves the rng stream;
+#  3: enemy shots left in a room are dropped when the player leaves;
+#  4: room events tick once per frame instead of twice;
+#  5: aimed boss spreads rotate cached offset tables)
+VERSION = 5
+HAS_RESULT = 1
+
+# magic, version, flags, seed, frame count
+_HEADER = struct.Struct("<4sBBQI")
+# frames in the run, input bitmask (bit i = INPUT_KEYS[i] held)
+_RUN = struct.Struct("<HB")
+# score, rooms cleared, player health at the end of the log
+_RESULT = struct.Struct("<iii")
+_MAX_RUN = 0xFFFF
+MAX_SEED = 2 ** 64 - 1  # the header's unsigned 64-bit seed field
+
+
+def input_mask(inputs):
+    """Pack the simulation keys held in inputs into one byte."""
+    mask = 0
+    for bit, key in enumerate(INPUT_KEYS):
+        if inputs[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_input(mask):
+    return FrameInput(key for bit, key in enumerate(INPUT_KEYS) if mask >> bit & 1)
+
+
+def sim_result(sim):
+    return sim.score, sim.dungeon.rooms_cleared_total, sim.player.health
+
+
+class Replay:
+    """
+    Seed plus one input byte per frame, stored run-length encoded: held keys
+    rarely change between frames, so a minute of play is a few hundred bytes.
+    result is (score, rooms cleared, health) when the run was recorded, or None.
+    seed must fit the header (0..MAX_SEED); anything else raises ValueError
+    here rather than when the replay is saved.
+    """
+
+    def __init__(self, seed, masks=(), result=None):
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f"replay seed must be between 0 and {MAX_SEED}, got {seed}")
+        self.seed = seed
+        self.masks = bytearray(masks)
+        self.result = result
+
+    def __len__(self):
+        return len(self.masks)
+
+    def inputs(self):
+        """FrameInput per frame, decoding each distinct mask once."""
+        decoded = {}
+        for mask in self.masks:
+            frame_input = decoded.get(mask)
+            if frame_input is None:
+                frame_input = decoded[mask] = mask_input(mask)
+            yield frame_input
+
+    def to_bytes(self):
+        flags = HAS_RESULT if self.result is not None else 0
+        out = [_HEADER.pack(MAGIC, VERSION, flags, self.seed, len(self.masks))]
+        masks = self.masks
+        i = 0
+        while i < len(masks):
+            mask = masks[i]
+            j = i + 1
+            while j < len(masks) and masks[j] == mask and j - i < _MAX_RUN:
+                j += 1
+            out.append(_RUN.pack(j - i, mask))
+            i = j
+        if self.result is not None:
+            out.append(_RESULT.pack(*self.result))
+        return b"".join(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, flags, seed, frames = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        offset = _HEADER.size
+        masks = bytearray()
+        while len(masks) < frames:
+            count, mask = _RUN.unpack_from(data, offset)
+            offset += _RUN.size
+            masks.extend(bytes((mask,)) * count)
+        result = _RESULT.unpack_from(data, offset) if flags & HAS_RESULT else None
+        return cls(seed, masks, result)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Log the inputs fed to a Simulation, one record() per step()."""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.replay = Replay(sim.seed)
+
+    def restart(self):
+        """Drop the log and follow the sim's current run (call after sim.reset())."""
+        self.replay = Replay(self.sim.seed)
+
+    def record(self, inputs):
+        self.replay.masks.append(input_mask(inputs))
+
+    def save(self, path):
+        self.replay.result = sim_result(self.sim)
+        self.replay.save(path)
+
+
+def simulate(replay):
+    """Re-run a replay headless at full speed. Returns the Simulation."""
+    sim = Simulation(seed=replay.seed)
+    step = sim.step
+    for frame_input in replay.inputs():
+        step(frame_input)
+    return sim
+
+
+if __name__ == "__main__":
+    replay = Replay.load(sys.argv[1])
+    start = time.perf_counter()
+    sim = simulate(replay)
+    elapsed = time.perf_counter() - start
+    result = sim_result(sim)
+    print(f"{len(replay)} frames in {elapsed:.2f}s ({len(replay) / max(elapsed, 1e-9):.0f} fps), "
+          f"score {result[0]}, rooms {result[1]}, health {result[2]}")
+    if replay.result is not None and tuple(replay.result) != result:
+        print(f"DESYNC: recorded score/rooms/health {tuple(replay.result)}")
+        sys.exit(1)
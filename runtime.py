@@ -0,0 +1,67 @@
+# runtime.py  (per-run random stream and the frame-counted simulation clock)
+import random
+
+
+class SimClock:
+    """
+    Simulation time, counted in frames.
+    ticks() replaces pygame.time.get_ticks() inside the simulation, so
+    cooldowns and wobbles follow frames stepped instead of wall time and a
+    run plays out the same however fast it is stepped.
+    """
+
+    def __init__(self, fps=60):
+        self.fps = fps
+        self.frame = 0
+
+    def advance(self):
+        self.frame += 1
+
+    def reset(self):
+        self.frame = 0
+
+    def ticks(self):
+        """Milliseconds of simulated time."""
+        return self.frame * 1000 // self.fps
+
+
+class _Bound:
+    """
+    Forwards attribute access to whatever bind() last pointed it at, so
+    modules can import rng once and still draw from the run being stepped.
+    """
+
+    __slots__ = ("target",)
+
+    def __init__(self, target):
+        self.target = target
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+# Every gameplay random draw goes through rng; never use the random module
+# directly in simulation code. Each Simulation owns its own Random and
+# SimClock and binds them here at the start of reset() and step().
+rng = _Bound(random.Random())
+clock = _Bound(SimClock(60))  # game.FPS
+
+
+def ticks():
+    return clock.target.ticks()
+
+
+def bind(stream, sim_clock):
+    """Point rng and ticks() at one run's random stream and clock."""
+    rng.target = stream
+    clock.target = sim_clock
+
+
+def start_run(stream, sim_clock, seed=None):
+    """Reseed stream, rewind sim_clock and bind both. Returns the seed used."""
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    stream.seed(seed)
+    sim_clock.reset()
+    bind(stream, sim_clock)
+    return seed
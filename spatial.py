@@ -0,0 +1,130 @@
+# spatial.py  (uniform-grid spatial hash for room entities, baked wall maps)
+import math
+from functools import reduce
+
+import numpy as np
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """
+    Uniform grid over the rects of a sprite group.
+    Each sprite is bucketed into every cell its rect overlaps, so a query only
+    visits the cells around the query rect instead of the whole group.
+    Rebuild once per frame after the sprites have moved.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.order = {}
+        self.group = None
+
+    def rebuild(self, group):
+        cs = self.cell_size
+        cells = {}
+        order = {}
+        for i, sprite in enumerate(group.sprites()):
+            # remember group order so queries report hits the way spritecollide does
+            order[sprite] = i
+            r = sprite.rect
+            for cx in range(r.left // cs, (r.right - 1) // cs + 1):
+                for cy in range(r.top // cs, (r.bottom - 1) // cs + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [sprite]
+                    else:
+                        bucket.append(sprite)
+        self.cells = cells
+        self.order = order
+        self.group = group
+
+    def candidates(self, rect):
+        """Sprites sharing a cell with rect that are still in the group."""
+        cs = self.cell_size
+        cells = self.cells
+        found = set()
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        group = self.group
+        return [s for s in found if group.has(s)]
+
+    def query_rect(self, rect):
+        """
+        Sprites whose rect collides with rect, in group order.
+        Same result as pygame.sprite.spritecollide against the indexed group.
+        """
+        hits = [s for s in self.candidates(rect) if rect.colliderect(s.rect)]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def query_radius(self, center, radius):
+        """
+        Sprites whose rect center lies within radius of center, in group order.
+        Compares squared distances, so no square roots are taken.
+        """
+        cx, cy = center
+        cs = self.cell_size
+        cells = self.cells
+        found = set()
+        for gx in range(int((cx - radius) // cs), int((cx + radius) // cs) + 1):
+            for gy in range(int((cy - radius) // cs), int((cy + radius) // cs) + 1):
+                bucket = cells.get((gx, gy))
+                if bucket:
+                    found.update(bucket)
+        group = self.group
+        r2 = radius * radius
+        hits = []
+        for s in found:
+            ex, ey = s.rect.center
+            if (ex - cx) * (ex - cx) + (ey - cy) * (ey - cy) <= r2 and group.has(s):
+                hits.append(s)
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+
+class WallMap:
+    """
+    Static wall rects baked into a tile grid with a summed-area table, so
+    asking whether a rect touches any wall costs four lookups however many
+    walls there are. The tile is the gcd of every wall edge and the room size
+    (10 px for the stock layout), so each tile is all wall or all floor and
+    the answer is exactly rect.colliderect against each wall.
+    """
+
+    def __init__(self, rects, width, height):
+        rects = [tuple(r) for r in rects]
+        self.tile = t = reduce(math.gcd, (v for r in rects for v in r), math.gcd(width, height))
+        self.cols = cols = -(-width // t)
+        self.rows = rows = -(-height // t)
+        grid = np.zeros((rows, cols), dtype=np.int32)
+        for x, y, w, h in rects:
+            grid[y // t:(y + h) // t, x // t:(x + w) // t] = 1
+        # sat[r, c] = wall tiles above and left of tile (r, c)
+        self.sat = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+        self.sat[1:, 1:] = grid.cumsum(axis=0).cumsum(axis=1)
+        self._sat_rows = self.sat.tolist()  # plain lists are faster for one rect at a time
+
+    def collide_rect(self, rect):
+        """True if rect overlaps any wall."""
+        t = self.tile
+        c0 = min(max(rect.left // t, 0), self.cols)
+        c1 = min(max(-(-rect.right // t), 0), self.cols)
+        r0 = min(max(rect.top // t, 0), self.rows)
+        r1 = min(max(-(-rect.bottom // t), 0), self.rows)
+        s = self._sat_rows
+        return s[r1][c1] - s[r0][c1] - s[r1][c0] + s[r0][c0] > 0
+
+    def collide_rects(self, left, top, right, bottom):
+        """collide_rect over arrays of rect edges; returns a bool array."""
+        t = self.tile
+        c0 = np.clip(left // t, 0, self.cols)
+        c1 = np.clip(-(-right // t), 0, self.cols)
+        r0 = np.clip(top // t, 0, self.rows)
+        r1 = np.clip(-(-bottom // t), 0, self.rows)
+        s = self.sat
+        return s[r1, c1] - s[r0, c1] - s[r1, c0] + s[r0, c0] > 0
@@ -1,472 +1,128 @@
 # main.py (UPDATED)
 import pygame
 import sys
-import random
 
-# Import the new boss creation helper and BossEnemy class
-from player import (
-    Player, Projectile, Enemy, ShooterEnemy, JumperEnemy,
-    EnemyProjectile, Particle, AirstrikeEvent, create_boss_by_index, BossEnemy
-)
-
-# --- Settings ---
-WIDTH, HEIGHT = 800, 600
-FPS = 60
+# World logic lives in game.py; this file is the windowed client around it
+from player import BossEnemy, PLANE_IMAGE
+from assets import preload, load_timings
+from game import Simulation, WIDTH, HEIGHT, FPS
+from hud import TextCache, BossBar
+from render import FullRenderer, DirtyRenderer
+from replay import ReplayRecorder
+from profiler import FrameProfiler, ProfilerOverlay
 
 # --- Colors ---
 GREY = (146, 142, 133)
-DARK_GREY = (59, 59, 59)
 HEALTH_BAR_COLOR = (255, 0, 0)
 HEALTH_BAR_BG_COLOR = (100, 0, 0)
 WHITE = (255, 255, 255)
 BOSS_BAR_BG = (30, 20, 20)
-BOSS_BAR_FG = (200, 130, 60)
-BOSS_NAME_COLOR = (230, 210, 170)
 
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Dungeon Shooter")
 clock = pygame.time.Clock()
 
+# --- Assets ---
+# read and display-convert image files now instead of mid-fight
+preload(PLANE_IMAGE)
+asset_line = "assets " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in load_timings().items())
+
 font = pygame.font.SysFont(None, 36)
 pause_font = pygame.font.SysFont(None, 72)
+hud_font = pygame.font.SysFont(None, 24)
+text_cache = TextCache()
+boss_bar = BossBar(font, WIDTH, text_cache)
 
-# --- Difficulty Scaling ---
-ROOMS_CLEARED_TOTAL = 0  # Global Variable
-DIFFICULTY_LEVEL = 1  # Global Variable
-BASE_ENEMIES = 3
-ENEMY_HEALTH_SCALE = 1.2
-BOSS_INTERVAL = 5  # Boss every 5 cleared rooms
-
-# --- Wall Class ---
-class Wall(pygame.sprite.Sprite):
-    def __init__(self, x, y, w, h):
-        super().__init__()
-        self.image = pygame.Surface((w, h))
-        self.image.fill(DARK_GREY)
-        self.rect = self.image.get_rect(topleft=(x, y))
-
-
-# --- PowerUp ---
-class PowerUp(pygame.sprite.Sprite):
-    TYPES = ["health", "multi", "speed", "rapid", "pierce", "explosive"]
-
-    def __init__(self, x, y, kind=None):
-        super().__init__()
-        self.type = kind if kind else random.choice(PowerUp.TYPES)
-        self.image = pygame.Surface((20, 20))
-        cmap = {
-            "health": (0, 255, 0),
-            "multi": (0, 200, 255),
-            "speed": (0, 0, 255),
-            "rapid": (255, 255, 0),
-            "pierce": (255, 100, 0),
-            "explosive": (200, 0, 200)
-        }
-        self.image.fill(cmap.get(self.type, (255, 255, 255)))
-        self.rect = self.image.get_rect(center=(x, y))
-        self.timer = 20 * FPS
-
-    def update(self):
-        self.timer -= 1
-        if self.timer <= 0:
-            self.kill()
-
-
-# --- Enemy Spawning ---
-def spawn_enemy_type():
-    r = random.random()
-    if r < 0.6:
-        return Enemy
-    elif r < 0.85:
-        return ShooterEnemy
-    else:
-        return JumperEnemy
-
-
-def spawn_enemy_far_from_player(player):
-    for _ in range(200):
-        x = random.randint(150, WIDTH - 150)
-        y = random.randint(150, HEIGHT - 150)
-        dist = ((x - player.rect.centerx) ** 2 + (y - player.rect.centery) ** 2) ** 0.5
-        if dist > 200:
-            return spawn_enemy_type()(x, y)
-    return spawn_enemy_type()(150, 150)
-
-
-# --- Room ---
-class Room:
-    def __init__(self, x, y):
-        self.coords = (x, y)
-        self.enemies = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.enemy_projectiles = pygame.sprite.Group()
-        self.events = []
-        self.walls = pygame.sprite.Group()
-        self.door_walls = pygame.sprite.Group()  # Group for the door blocks
-        self.cleared = False
-        self.doors_locked = True
-        self.is_boss_room = False
-        self.create_walls_with_doors()
-
-        # boss UI state
-        self.boss_ui_alpha = 0
-        self.boss_ui_fade = False
-        self.boss_spawned = False
-
-    def create_walls_with_doors(self):
-        """
-        Creates outer walls and door blocks to seal the room.
-        Door blocks are now guaranteed to meet the permanent walls.
-        """
-        wall_thickness = 40
-        door_width = 100
-        door_block_thickness = 10
-        door_start_h = WIDTH // 2 - door_width // 2
-        door_end_h = WIDTH // 2 + door_width // 2
-        door_start_v = HEIGHT // 2 - door_width // 2
-        door_end_v = HEIGHT // 2 + door_width // 2
-
-        # --- Permanent Base Walls (creating the door gap) ---
-        self.walls.add(Wall(0, 0, door_start_h, wall_thickness))
-        self.walls.add(Wall(door_end_h, 0, WIDTH - door_end_h, wall_thickness))
-        self.walls.add(Wall(0, HEIGHT - wall_thickness, door_start_h, wall_thickness))
-        self.walls.add(Wall(door_end_h, HEIGHT - wall_thickness, WIDTH - door_end_h, wall_thickness))
-        self.walls.add(Wall(0, 0, wall_thickness, door_start_v))
-        self.walls.add(Wall(0, door_end_v, wall_thickness, HEIGHT - door_end_v))
-        self.walls.add(Wall(WIDTH - wall_thickness, 0, wall_thickness, door_start_v))
-        self.walls.add(Wall(WIDTH - wall_thickness, door_end_v, wall_thickness, HEIGHT - door_end_v))
-
-        # --- Door Blocks (Fill the gap when locked) ---
-        top_block = Wall(door_start_h, 0, door_width, door_block_thickness)
-        self.walls.add(top_block)
-        self.door_walls.add(top_block)
-        bottom_block = Wall(door_start_h, HEIGHT - door_block_thickness, door_width, door_block_thickness)
-        self.walls.add(bottom_block)
-        self.door_walls.add(bottom_block)
-        left_block = Wall(0, door_start_v, door_block_thickness, door_width)
-        self.walls.add(left_block)
-        self.door_walls.add(left_block)
-        right_block = Wall(WIDTH - door_block_thickness, door_start_v, door_block_thickness, door_width)
-        self.walls.add(right_block)
-        self.door_walls.add(right_block)
-
-    def spawn_enemies(self, player):
-        # Determine if this room should spawn a boss
-        global ROOMS_CLEARED_TOTAL, DIFFICULTY_LEVEL
-
-        if ROOMS_CLEARED_TOTAL > 0 and (ROOMS_CLEARED_TOTAL + 1) % BOSS_INTERVAL == 0:
-            self.is_boss_room = True
-
-            # Determine boss index (0-based) and boss stage
-            boss_num = ((ROOMS_CLEARED_TOTAL + 1) // BOSS_INTERVAL) - 1
-            boss_index = boss_num % 20
-            boss_stage = boss_num  # number of bosses that have been faced before
-
-            # Create boss via helper (now passes boss_stage)
-            boss = create_boss_by_index(boss_index, WIDTH // 2, HEIGHT // 2, DIFFICULTY_LEVEL, boss_stage)
-            self.enemies.add(boss)
-            self.boss_ui_fade = True
-            self.boss_ui_alpha = 0
-            self.boss_spawned = True
-            print(f"BOSS SPAWNED: #{boss_index+1} ({getattr(boss, 'display_name', boss.__class__.__name__)}) Health {boss.max_health}")
-        else:
-            # Spawn regular enemies
-            num_enemies = int(BASE_ENEMIES + DIFFICULTY_LEVEL * 0.5)
-
-            for _ in range(random.randint(num_enemies, num_enemies + 2)):
-                e = spawn_enemy_far_from_player(player)
-                # Scale enemy health
-                e.max_health = int(e.max_health * (ENEMY_HEALTH_SCALE ** (DIFFICULTY_LEVEL - 1)))
-                e.health = e.max_health
-                self.enemies.add(e)
-
-    def unlock_doors(self):
-        # REQUIRED to modify top-level variables
-        global ROOMS_CLEARED_TOTAL, DIFFICULTY_LEVEL
-
-        # Remove all door blocks, opening the path
-        for wall in list(self.door_walls):
-            wall.kill()
-
-        self.doors_locked = False
-
-        # Increase cleared room count and scale difficulty
-        ROOMS_CLEARED_TOTAL += 1
-        DIFFICULTY_LEVEL = (ROOMS_CLEARED_TOTAL // 3) + 1
-
-    def update(self, player, particle_group, projectile_group):
-        # events (like airstrike)
-        for event in list(self.events):
-            event.update(screen, player, self.enemies, particle_group)
-            if not event.active:
-                self.events.remove(event)
-
-        # enemy AI
-        for enemy in list(self.enemies):
-            result = enemy.update(player)
-            if result is not None:
-                # handle single sprite returns
-                if isinstance(result, pygame.sprite.Sprite):
-                    # If the returned sprite is an Enemy => spawn it into enemies
-                    if isinstance(result, Enemy):
-                        self.enemies.add(result)
-                    # If it's a projectile => add to enemy_projectiles (tag with source & damage)
-                    elif isinstance(result, EnemyProjectile):
-                        # associate with source enemy, scale damage if enemy has projectile_damage
-                        result.source = enemy
-                        result.damage = getattr(enemy, "projectile_damage", getattr(enemy, "contact_damage", 1))
-                        self.enemy_projectiles.add(result)
-                    else:
-                        # default: add to enemy_projectiles
-                        try:
-                            result.source = enemy
-                            result.damage = getattr(enemy, "projectile_damage", getattr(enemy, "contact_damage", 1))
-                        except Exception:
-                            pass
-                        self.enemy_projectiles.add(result)
-                elif isinstance(result, list):
-                    # a mixed list might contain projectiles and/or enemies
-                    for r in result:
-                        if isinstance(r, Enemy):
-                            self.enemies.add(r)
-                        elif isinstance(r, EnemyProjectile):
-                            # tag projectile with its source and scale damage
-                            r.source = enemy
-                            r.damage = getattr(enemy, "projectile_damage", getattr(enemy, "contact_damage", 1))
-                            self.enemy_projectiles.add(r)
-                        else:
-                            # assume projectile-like
-                            try:
-                                # if it's a projectile-like sprite, tag it
-                                r.source = enemy
-                                r.damage = getattr(enemy, "projectile_damage", getattr(enemy, "contact_damage", 1))
-                                self.enemy_projectiles.add(r)
-                            except Exception:
-                                pass
-
-        # check clear
-        if not self.cleared and not self.enemies:
-            self.cleared = True
-            self.unlock_doors()
-            # drop powerup chance
-            if random.random() < 0.75 or self.is_boss_room:
-                self.powerups.add(PowerUp(WIDTH // 2, HEIGHT // 2))
-
-            # If it was a boss room, drop an extra guaranteed powerup
-            if self.is_boss_room:
-                self.powerups.add(PowerUp(WIDTH // 2 + 50, HEIGHT // 2 + 50))
-
-            # Chance to trigger an Airstrike
-            if random.random() < 0.2:
-                airstrike = AirstrikeEvent(
-                    WIDTH, HEIGHT,
-                    player.rect.centerx,
-                    player.rect.centery,
-                    pygame
-                )
-                self.events.append(airstrike)
-
-
-# --- Dungeon ---
-class Dungeon:
-    def __init__(self):
-        self.rooms = {}
-        self.current = (0, 0)
-        self.load_room(0, 0)
-
-    def load_room(self, x, y):
-        if (x, y) not in self.rooms:
-            room = Room(x, y)
-            room.spawn_enemies(player)
-            self.rooms[(x, y)] = room
-        self.current = (x, y)
-
-    def get_room(self):
-        return self.rooms[self.current]
-
-    def move(self, direction):
-        x, y = self.current
-        if direction == "up":
-            y -= 1
-        elif direction == "down":
-            y += 1
-        elif direction == "left":
-            x -= 1
-        elif direction == "right":
-            x += 1
-        self.load_room(x, y)
-
-
-# --- Transition Check ---
-def check_room_transition(player, dungeon):
-    margin = 10
-    px, py = player.rect.center
-
-    if dungeon.get_room().doors_locked:
-        return
 
-    if py < margin:  # top
-        dungeon.move("up")
-        player.pos_y = HEIGHT - 100
-    elif py > HEIGHT - margin:
-        dungeon.move("down")
-        player.pos_y = 100
-    elif px < margin:
-        dungeon.move("left")
-        player.pos_x = WIDTH - 120
-    elif px > WIDTH - margin:
-        dungeon.move("right")
-        player.pos_x = 120
-
-    player.rect.centerx = int(player.pos_x)
-    player.rect.centery = int(player.pos_y)
-
-
-# --- Create Player and Groups ---
-player = Player(WIDTH // 2, HEIGHT // 2)
+def draw_boss_ui(room):
+    # only if room flagged as boss room and a boss exists
+    if not room.is_boss_room:
+        return
+    bosses = [e for e in room.enemies.sprites() if isinstance(e, BossEnemy)]
+    if not bosses:
+        # fade out the UI after boss cleared
+        if room.boss_ui_alpha > 0:
+            room.boss_ui_alpha = max(0, room.boss_ui_alpha - 12)
+        return
+    boss = bosses[0]
+    # fade in
+    if room.boss_ui_alpha < 255:
+        room.boss_ui_alpha = min(255, room.boss_ui_alpha + 14)
+    return boss_bar.draw(screen, boss, room.boss_ui_alpha, pygame.time.get_ticks())
+
+
+# --- Renderer ---
+# python test.py --dirty : only push changed rects (for low-power machines)
+if "--dirty" in sys.argv:
+    renderer = DirtyRenderer(screen, GREY)
+else:
+    renderer = FullRenderer(screen, GREY)
+
+
+# --- Create Simulation ---
+# python test.py --seed N : replay the same dungeon
+seed = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else None
+sim = Simulation(seed=seed)
+player = sim.player
 PLAYER_MAX_HEALTH = player.PLAYER_MAX_HEALTH
-player_group = pygame.sprite.GroupSingle(player)
-projectile_group = pygame.sprite.Group()
-particle_group = pygame.sprite.Group() #
 
-dungeon = Dungeon()
+# python test.py --record run.rpl : log inputs; the last run is saved on quit
+# and can be re-simulated with python replay.py run.rpl
+# (the seed is checked here, before the run, so a bad --seed can't lose the log)
+record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv else None
+recorder = ReplayRecorder(sim) if record_path else None
+
+# --- Profiler ---
+# F3 toggles the frame-time overlay, F4 writes profile.csv and profile.json
+profiler = FrameProfiler()
+sim.profiler = profiler
+profile_overlay = ProfilerOverlay(profiler, hud_font)
 
-score = 0
 paused = False
-game_over = False
 
 # --- Main Loop ---
 while True:
+    profiler.start_frame()
+    profiler.phase("input")
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            if recorder:
+                recorder.save(record_path)
             pygame.quit()
             sys.exit()
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE and not game_over:
+            if event.key == pygame.K_ESCAPE and not sim.game_over:
                 paused = not paused
-            if game_over and event.key == pygame.K_r:
+            elif event.key == pygame.K_F3:
+                profile_overlay.toggle()
+            elif event.key == pygame.K_F4:
+                profiler.export_csv("profile.csv")
+                profiler.export_json("profile.json")
+            if sim.game_over and event.key == pygame.K_r:
                 # --- Restart Logic ---
-                ROOMS_CLEARED_TOTAL = 0
-                DIFFICULTY_LEVEL = 1
-
-                dungeon = Dungeon()
-                player.health = PLAYER_MAX_HEALTH
-                player.multi_shot_level = 1
-                player.speed_level = 0
-                player.rapid_level = 0
-                player.piercing_level = 0
-                player.explosive_level = 0
-                player.last_shot_time = 0
-                player.invul_timer = 0
-                projectile_group.empty()
-                particle_group.empty()
-                player.pos_x, player.pos_y = WIDTH // 2, HEIGHT // 2
-                player.rect.center = (WIDTH // 2, HEIGHT // 2)
-                score = 0
-                game_over = False
-                # -------------------------
-
-    if not paused and not game_over:
-        keys = pygame.key.get_pressed()
+                sim.reset(seed)  # same dungeon again under --seed
+                if recorder:
+                    recorder.restart()
 
-        # Player shooting
-        if player.can_attack():
-            direction = None
-            if keys[pygame.K_UP]:
-                direction = "up"
-            elif keys[pygame.K_DOWN]:
-                direction = "down"
-            elif keys[pygame.K_LEFT]:
-                direction = "left"
-            elif keys[pygame.K_RIGHT]:
-                direction = "right"
-            if direction:
-                for p in player.attack(direction):
-                    projectile_group.add(p)
-
-        room = dungeon.get_room()
-        player_group.update(room.walls, keys)
-        projectile_group.update(room.walls)
-        particle_group.update()
-        room.powerups.update()
-        room.enemy_projectiles.update(room.walls)
-
-        room.update(player, particle_group, projectile_group)
-        check_room_transition(player, dungeon)
-
-        # Enemy collisions (now uses player.take_damage for i-frames/knockback)
-        for enemy in list(room.enemies):
-            if player.rect.colliderect(enemy.rect):
-                player.take_damage(enemy.rect.centerx, enemy.rect.centery, damage=getattr(enemy, "contact_damage", 1))
-
-        # Projectile hits (unchanged - applies damage to enemies)
-        for proj in list(projectile_group):
-            hits = pygame.sprite.spritecollide(proj, room.enemies, False)
-            if hits:
-                if getattr(proj, "explosive", 0) > 0:
-                    cx, cy = proj.rect.center
-                    radius = 50 + proj.explosive * 20
-                    for enemy in list(room.enemies):
-                        ex, ey = enemy.rect.center
-                        if ((ex - cx) ** 2 + (ey - cy) ** 2) ** 0.5 <= radius:
-                            for _ in range(1 + proj.explosive):
-                                if enemy.take_hit():
-                                    enemy.kill()
-                                    score += 1
-                                    for _ in range(6):
-                                        particle_group.add(Particle(ex, ey))
-                    proj.kill()
-                else:
-                    for enemy in hits:
-                        if proj.hits_left > 0:
-                            if enemy.take_hit():
-                                enemy.kill()
-                                score += 1
-                                for _ in range(6):
-                                    particle_group.add(Particle(enemy.rect.centerx, enemy.rect.centery))
-                            proj.hits_left -= 1
-                        if proj.hits_left <= 0:
-                            proj.kill()
-                            break
-
-        # Enemy projectiles (now uses player.take_damage for i-frames/knockback)
-        for ep in list(room.enemy_projectiles):
-            if player.rect.colliderect(ep.rect):
-                ep.kill()
-                player.take_damage(ep.rect.centerx, ep.rect.centery, damage=getattr(ep, "damage", 1))
-
-        # Powerups
-        collected = pygame.sprite.spritecollide(player, room.powerups, True)
-        for pu in collected:
-            if pu.type == "health":
-                player.health = min(PLAYER_MAX_HEALTH, player.health + 2)
-            elif pu.type == "multi":
-                if player.multi_shot_level == 1:
-                    player.multi_shot_level = 3
-                else:
-                    player.multi_shot_level += 2
-            elif pu.type == "speed":
-                player.speed_level += 1
-            elif pu.type == "rapid":
-                player.rapid_level += 1
-            elif pu.type == "pierce":
-                player.piercing_level += 1
-            elif pu.type == "explosive":
-                player.explosive_level += 1
-
-        if player.health <= 0:
-            game_over = True
+    if not paused and not sim.game_over:
+        keys = pygame.key.get_pressed()
+        if recorder:
+            recorder.record(keys)
+        sim.step(keys)
 
     # --- Draw ---
-    screen.fill(GREY)
-    room = dungeon.get_room()
-    room.walls.draw(screen)
+    profiler.phase("draw")
+    room = sim.get_room()
+    renderer.begin(room)
+    dirty = renderer.dirty
 
     # Player is drawn via player_group.draw(screen) below
 
-    projectile_group.draw(screen)
+    renderer.mark_all(sim.projectiles.draw(screen, dirty))
     room.enemies.draw(screen)
+    if dirty:
+        renderer.mark_all(room.enemies.spritedict.values())
 
     # Draw health bars for non-boss enemies; boss uses top-centered UI
     for enemy in room.enemies.sprites():
@@ -474,121 +130,60 @@ while True:
             # skip per-boss-head healthbar - handled via top UI
             continue
         enemy.draw_health_bar(screen)
+        if dirty:
+            renderer.mark(pygame.Rect(enemy.rect.x, enemy.rect.y - 12, enemy.rect.width, 12))
 
-    room.enemy_projectiles.draw(screen)
-    particle_group.draw(screen)
+    renderer.mark_all(room.enemy_projectiles.draw(screen, dirty))
+    renderer.mark_all(sim.particles.draw(screen, dirty))
     room.powerups.draw(screen)
 
     # Draw player (handles flashing logic inside Player.update)
-    player_group.draw(screen)
+    sim.player_group.draw(screen)
+    if dirty:
+        renderer.mark_all(room.powerups.spritedict.values())
+        renderer.mark_all(sim.player_group.spritedict.values())
 
-    # Draw Airstrike Events
-    for event in room.events:
-        event.update(screen, player, room.enemies, particle_group)
+    # Draw Airstrike Events (they draw across the whole screen)
+    if room.events:
+        renderer.invalidate()
+        room.events.render(screen)
 
     # HUD
-    pygame.draw.rect(screen, HEALTH_BAR_BG_COLOR, (10, 10, 150, 20))
+    renderer.mark(pygame.draw.rect(screen, HEALTH_BAR_BG_COLOR, (10, 10, 150, 20)))
     health_width = int(150 * (player.health / PLAYER_MAX_HEALTH))
     pygame.draw.rect(screen, HEALTH_BAR_COLOR, (10, 10, health_width, 20))
 
-    score_text = font.render(f"Score: {score}", True, (0, 0, 0))
-    room_text = font.render(f"Room: {room.coords}", True, (0, 0, 0))
-    difficulty_text = font.render(f"Level: {DIFFICULTY_LEVEL}", True, (0, 0, 0))
+    score_text = text_cache.render(font, f"Score: {sim.score}", True, (0, 0, 0))
+    room_text = text_cache.render(font, f"Room: {room.coords}", True, (0, 0, 0))
+    difficulty_text = text_cache.render(font, f"Level: {sim.dungeon.difficulty_level}", True, (0, 0, 0))
 
     # Boss UI (top-centered) - stylized medieval frame + title + centered health bar
-    def draw_boss_ui(room):
-        # only if room flagged as boss room and a boss exists
-        if not room.is_boss_room:
-            return
-        bosses = [e for e in room.enemies.sprites() if isinstance(e, BossEnemy)]
-        if not bosses:
-            # fade out the UI after boss cleared
-            if room.boss_ui_alpha > 0:
-                room.boss_ui_alpha = max(0, room.boss_ui_alpha - 12)
-            return
-        boss = bosses[0]
-        # fade in
-        if room.boss_ui_alpha < 255:
-            room.boss_ui_alpha = min(255, room.boss_ui_alpha + 14)
-
-        alpha = room.boss_ui_alpha
-        # create surface for UI so we can set alpha smoothly
-        ui_h = 88
-        ui_w = WIDTH
-        surf = pygame.Surface((ui_w, ui_h), pygame.SRCALPHA)
-        # semi-ornate plate behind bar
-        plate_rect = (ui_w//2 - 340, 8, 680, 36)
-        # medieval-ish glowing frame (simple)
-        pygame.draw.rect(surf, (20, 14, 10, alpha), plate_rect, border_radius=8)
-        pygame.draw.rect(surf, (80, 50, 30, alpha), (plate_rect[0]+4, plate_rect[1]+4, plate_rect[2]-8, plate_rect[3]-8), border_radius=6)
-        # spikes/decals on sides (medieval: stylized horns)
-        left_x = plate_rect[0]
-        right_x = plate_rect[0] + plate_rect[2]
-        mid_y = plate_rect[1] + plate_rect[3]//2
-        # left horn
-        pygame.draw.polygon(surf, (60, 40, 25, alpha), [(left_x-12, mid_y), (left_x+6, mid_y-12), (left_x+6, mid_y+12)])
-        # right horn
-        pygame.draw.polygon(surf, (60, 40, 25, alpha), [(right_x+12, mid_y), (right_x-6, mid_y-12), (right_x-6, mid_y+12)])
-        # decorative rivets
-        for i in range(6):
-            rx = plate_rect[0] + 20 + i * 110
-            pygame.draw.circle(surf, (100, 70, 50, alpha), (rx, plate_rect[1] + plate_rect[3]//2), 4)
-
-        # boss name (bold)
-        name_text = font.render(f"BOSS: {getattr(boss, 'display_name', boss.__class__.__name__)}", True, BOSS_NAME_COLOR)
-        name_x = ui_w//2 - name_text.get_width()//2
-        surf.blit(name_text, (name_x, plate_rect[1]-26))
-
-        # centered health bar beneath
-        bar_w = 600
-        bar_h = 18
-        bar_x = ui_w//2 - bar_w//2
-        bar_y = plate_rect[1] + plate_rect[3] + 8
-        # background plate
-        pygame.draw.rect(surf, (20, 12, 8, alpha), (bar_x-6, bar_y-6, bar_w+12, bar_h+12), border_radius=10)
-        # bar background
-        pygame.draw.rect(surf, (50, 20, 10, alpha), (bar_x, bar_y, bar_w, bar_h), border_radius=8)
-        ratio = max(0.0, boss.health / boss.max_health)
-        cur_w = int(bar_w * ratio)
-        # pulse if < 25%
-        pulse = 0
-        if ratio < 0.25:
-            pulse = int((1 + (pygame.time.get_ticks() // 200) % 2) * 6)
-        pygame.draw.rect(surf, (BOSS_BAR_FG[0], BOSS_BAR_FG[1], BOSS_BAR_FG[2], alpha),
-                         (bar_x - pulse//2, bar_y - pulse//2, max(2, cur_w + pulse), bar_h + pulse), border_radius=8)
-
-        # draw the composed UI onto main screen with overall alpha
-        surf.set_alpha(alpha)
-        screen.blit(surf, (0, 8))
-
-    # call to draw boss UI
-    draw_boss_ui(room)
+    renderer.mark(draw_boss_ui(room))
 
     # Boss health warning (if you still want a small in-corner readout)
     if room.is_boss_room and room.enemies:
         boss = [e for e in room.enemies.sprites() if isinstance(e, BossEnemy)][0]
-        boss_health_text = font.render(f"{getattr(boss, 'display_name', boss.__class__.__name__)} HP: {boss.health}/{boss.max_health}", True, (255, 220, 180))
-        screen.blit(boss_health_text, (WIDTH//2 - boss_health_text.get_width()//2, 56))
+        boss_health_text = text_cache.render(font, f"{getattr(boss, 'display_name', boss.__class__.__name__)} HP: {boss.health}/{boss.max_health}", True, (255, 220, 180))
+        renderer.mark(screen.blit(boss_health_text, (WIDTH//2 - boss_health_text.get_width()//2, 56)))
 
-    screen.blit(score_text, (10, 40))
-    screen.blit(room_text, (10, 70))
-    screen.blit(difficulty_text, (10, 100))
+    renderer.mark(screen.blit(score_text, (10, 40)))
+    renderer.mark(screen.blit(room_text, (10, 70)))
+    renderer.mark(screen.blit(difficulty_text, (10, 100)))
 
-    if paused and not game_over:
-        pause_text = pause_font.render("PAUSED", True, WHITE)
+    if paused and not sim.game_over:
+        pause_text = text_cache.render(pause_font, "PAUSED", True, WHITE)
         rect = pause_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        screen.blit(pause_text, rect)
+        renderer.mark(screen.blit(pause_text, rect))
 
-    if game_over:
-        over_text = pause_font.render("GAME OVER", True, (255, 0, 0))
+    if sim.game_over:
+        over_text = text_cache.render(pause_font, "GAME OVER", True, (255, 0, 0))
         rect = over_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
-        screen.blit(over_text, rect)
-        instr_text = font.render("Press R to Restart", True, WHITE)
+        renderer.mark(screen.blit(over_text, rect))
+        instr_text = text_cache.render(font, "Press R to Restart", True, WHITE)
         rect2 = instr_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 20))
-        screen.blit(instr_text, rect2)
+        renderer.mark(screen.blit(instr_text, rect2))
 
     # Powerup stats
-    hud_font = pygame.font.SysFont(None, 24)
     y_offset = 130
     hud_lines = [
         f"Multishot: {player.multi_shot_level}",
@@ -598,9 +193,13 @@ while True:
         f"Explosive: {player.explosive_level}"
     ]
     for line in hud_lines:
-        text_surf = hud_font.render(line, True, (255, 255, 255))
-        screen.blit(text_surf, (10, y_offset))
+        text_surf = text_cache.render(hud_font, line, True, (255, 255, 255))
+        renderer.mark(screen.blit(text_surf, (10, y_offset)))
         y_offset += 20
 
-    pygame.display.flip()
+    renderer.mark(profile_overlay.draw(screen, (f"allocs/step {sim.allocations.last} (peak {sim.allocations.peak})", asset_line)))
+
+    profiler.phase("flip")
+    renderer.end()
+    profiler.end_frame()
     clock.tick(FPS)